@@ -0,0 +1,67 @@
+"""
+Alternatif rota benchmark'ı: Yen (ortak ağaçlı) ve via-node yöntemlerinin
+k=5 için sorgu süresi; karşılaştırma olarak NetworkX `shortest_simple_paths`.
+
+Kullanım:
+    python benchmarks/bench_alternatives.py --rows 200 --cols 200
+"""
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import networkx as nx  # noqa: E402
+
+from alternatives import compile_graph, k_shortest_paths, via_node_alternatives  # noqa: E402
+from utils import synthetic_city_graph  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--skip-networkx", action="store_true")
+    args = parser.parse_args()
+
+    G = synthetic_city_graph(args.rows, args.cols)
+    print(f"Graf: {G.number_of_nodes()} düğüm, {G.number_of_edges()} kenar")
+
+    t0 = time.perf_counter()
+    compiled = compile_graph(G)
+    print(f"Derleme (bir kez): {time.perf_counter() - t0:.3f} sn")
+
+    rng = random.Random(0)
+    nodes = list(G.nodes())
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(args.queries)]
+
+    def _time(fn):
+        t0 = time.perf_counter()
+        for s, g in pairs:
+            fn(s, g)
+        return (time.perf_counter() - t0) / len(pairs) * 1e3
+
+    yen = _time(lambda s, g: k_shortest_paths(G, s, g, k=args.k, compiled=compiled))
+    via = _time(lambda s, g: via_node_alternatives(G, s, g, k=args.k, compiled=compiled))
+    print(f"Yen (k={args.k}):      {yen:.1f} ms/sorgu")
+    print(f"Via-node (k={args.k}): {via:.1f} ms/sorgu")
+
+    if not args.skip_networkx:
+        nx_ms = _time(
+            lambda s, g: list(
+                itertools.islice(nx.shortest_simple_paths(G, s, g, weight="travel_time"), args.k)
+            )
+        )
+        print(f"NetworkX shortest_simple_paths (k={args.k}): {nx_ms:.1f} ms/sorgu")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Kompakt graf bellek benchmark'ı: NetworkX DiGraph ile compact_graph
+gösteriminin düğüm başına ve kenar başına bellek kullanımı (tracemalloc),
+ayrıca aynı sorgularda A* süresi ve sonuç eşitliği.
+
+Kullanım:
+    python benchmarks/bench_compact_graph.py                # ~1M kenar
+    python benchmarks/bench_compact_graph.py --rows 100 --cols 100 --queries 20
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import networkx as nx  # noqa: E402
+
+from astar_solver import solve_astar_constrained  # noqa: E402
+from compact_graph import compact_from_networkx, solve_astar_compact  # noqa: E402
+from utils import synthetic_city_graph  # noqa: E402
+
+
+def traced(fn):
+    """fn() çalıştırılırken ayrılan ve bellekte kalan bayt sayısı."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def networkx_memory(G: nx.DiGraph):
+    """G'nin bir kopyasını kurarak (düğüm bayt, kenar bayt) ölçer."""
+    H = nx.DiGraph()
+    _, node_bytes = traced(lambda: H.add_nodes_from(G.nodes(data=True)))
+    _, edge_bytes = traced(lambda: H.add_edges_from(G.edges(data=True)))
+    return node_bytes, edge_bytes
+
+
+def compact_memory(G: nx.DiGraph):
+    """
+    Kompakt grafı kurar; (cg, düğüm bayt, kenar bayt) döndürür.
+    Düğüm tarafı: id listesi + indeks sözlüğü + isimler + x/y/flags/indptr.
+    """
+    cg, total = traced(lambda: compact_from_networkx(G))
+    edge_arrays = ("head", "mode", "travel_time", "cost", "distance", "is_transfer")
+    edge_bytes = sum(cg[k].nbytes for k in edge_arrays)
+    return cg, total - edge_bytes, edge_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--cols", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=10)
+    args = parser.parse_args()
+
+    G = synthetic_city_graph(args.rows, args.cols)
+    n_nodes, n_edges = G.number_of_nodes(), G.number_of_edges()
+    print(f"Graf: {n_nodes} düğüm, {n_edges} kenar")
+
+    nx_nodes, nx_edges = networkx_memory(G)
+    cg, c_nodes, c_edges = compact_memory(G)
+
+    print(f"{'':12s}{'düğüm başına':>16s}{'kenar başına':>16s}{'toplam MB':>12s}")
+    for label, nb, eb in (("networkx", nx_nodes, nx_edges), ("compact", c_nodes, c_edges)):
+        print(
+            f"{label:12s}{nb / n_nodes:14.1f} B{eb / n_edges:14.1f} B"
+            f"{(nb + eb) / 2 ** 20:12.1f}"
+        )
+    print(
+        f"Kazanç: düğüm {nx_nodes / max(c_nodes, 1):.1f}x, "
+        f"kenar {nx_edges / max(c_edges, 1):.1f}x"
+    )
+
+    rng = random.Random(0)
+    nodes = list(G.nodes())
+    pairs = [tuple(rng.sample(nodes, 2)) for _ in range(args.queries)]
+
+    t0 = time.perf_counter()
+    ref = [solve_astar_constrained(G, s, g) for s, g in pairs]
+    t_nx = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    out = [solve_astar_compact(cg, s, g) for s, g in pairs]
+    t_cg = time.perf_counter() - t0
+
+    same = sum(
+        1
+        for (_, ta, _), (_, tb, _) in zip(ref, out)
+        if (ta is None and tb is None) or (ta is not None and tb is not None and abs(ta - tb) < 1e-3)
+    )
+    print(
+        f"A* ({len(pairs)} sorgu): networkx {t_nx / len(pairs) * 1000:.1f} ms/sorgu, "
+        f"compact {t_cg / len(pairs) * 1000:.1f} ms/sorgu, aynı süre: {same}/{len(pairs)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
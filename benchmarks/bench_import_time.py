@@ -0,0 +1,96 @@
+"""
+Soğuk başlangıç (import) süresi raporu: `python -X importtime` çıktısını
+senaryo bazında toplar ve en ağır modülleri listeler.
+
+Senaryolar:
+  - old_app:     eski arayüz açılışı: streamlit, pandas, altair, A*, NSGA-II/DEAP
+                 import edilir ve graf import anında kurulur
+  - app:         web/streamlit_app.py'nin kendisi (streamlit "bare" modunda,
+                 düğmeye basılmadan; graf ve algoritmalar yüklenmez)
+  - registry:    yalnızca registry importu
+  - first_astar: registry + ilk A* sorgusu; ilk "Rota Bul" tıklamasının
+                 ödediği maliyet (graf, pandas/numpy ve astar_solver yüklenir)
+
+Kullanım:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --top 15 --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+
+
+APP_PATH = os.path.join(BASE_DIR, "web", "streamlit_app.py")
+
+SCENARIOS = {
+    "old_app": (
+        "import streamlit, pandas, altair\n"
+        "import graph_builder, astar_solver, nsga_solver\n"
+        "from utils import load_default_graph\n"
+        "G = load_default_graph()\n"
+    ),
+    "app": f"import runpy\nrunpy.run_path({APP_PATH!r})\n",
+    "registry": "import registry\n",
+    "first_astar": (
+        "from registry import get_graph, get_solver\n"
+        "get_solver('astar')(get_graph(), 'N6', 'N8')\n"
+    ),
+}
+
+
+def import_times(code: str):
+    """
+    Kodu temiz bir yorumlayıcıda -X importtime ile çalıştırır.
+    (toplam import µs, süreç duvar saati sn, [(kümülatif µs, modül), ...]) döndürür.
+    """
+    # mevcut PYTHONPATH korunur (oradan kurulmuş paketler bulunabilsin)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=BASE_DIR,
+        check=True,
+    )
+    wall = time.perf_counter() - t0
+
+    total = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum_us, raw_name = line[len("import time:"):].split("|", 2)
+        cum = int(cum_us)
+        name = raw_name.strip()
+        modules.append((cum, name))
+        # yalnızca en üst seviye importlar toplama eklenir (iç içe olanlar girintili)
+        if len(raw_name) - len(raw_name.lstrip()) <= 1:
+            total += cum
+    return total, wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3, help="En iyi süre için tekrar sayısı")
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        runs = [import_times(code) for _ in range(args.repeat)]
+        total, wall, modules = min(runs, key=lambda r: r[0])
+
+        print(f"=== {name}: toplam import {total / 1000:.1f} ms, süreç {wall * 1000:.1f} ms ===")
+        for cum, mod in sorted(modules, reverse=True)[: args.top]:
+            print(f"  {cum / 1000:8.1f} ms  {mod}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
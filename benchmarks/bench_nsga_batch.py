@@ -0,0 +1,75 @@
+"""
+Çoklu OD NSGA-II benchmark'ı: run_nsga2 döngüsü ile run_nsga2_batch
+(paylaşımlı ön hesap, seri ve paralel) arasında cephe/sn karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_nsga_batch.py --rows 8 --cols 8 --pairs 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from nsga_batch import run_nsga2_batch  # noqa: E402
+from nsga_solver import run_nsga2  # noqa: E402
+from utils import synthetic_city_graph  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=8)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--origins", type=int, default=20, help="Farklı başlangıç düğümü sayısı")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--pop-size", type=int, default=40)
+    parser.add_argument("--max-len", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    G = synthetic_city_graph(args.rows, args.cols)
+    rng = random.Random(0)
+    nodes = list(G.nodes())
+    origins = rng.sample(nodes, min(args.origins, len(nodes)))
+    pairs = []
+    while len(pairs) < args.pairs:
+        s, g = rng.choice(origins), rng.choice(nodes)
+        if s != g:
+            pairs.append((s, g))
+    print(f"Graf: {G.number_of_nodes()} düğüm, {len(pairs)} OD çifti, {len(origins)} başlangıç")
+
+    common = dict(
+        n_generations=args.generations,
+        pop_size=args.pop_size,
+        max_intermediate_len=args.max_len,
+    )
+
+    def _report(label, fn):
+        t0 = time.perf_counter()
+        fronts = fn()
+        elapsed = time.perf_counter() - t0
+        solved = sum(1 for f in fronts if f)
+        print(f"{label:<28} {len(pairs) / elapsed:8.2f} cephe/sn  ({solved} çift çözüldü)")
+
+    _report(
+        "run_nsga2 döngüsü",
+        lambda: [run_nsga2(G, s, g, verbose=False, **common) for s, g in pairs],
+    )
+    _report(
+        "run_nsga2_batch (1 çekirdek)",
+        lambda: list(run_nsga2_batch(G, pairs, n_workers=1, **common).values()),
+    )
+    _report(
+        f"run_nsga2_batch ({args.workers} çekirdek)",
+        lambda: list(run_nsga2_batch(G, pairs, n_workers=args.workers, **common).values()),
+    )
+
+
+if __name__ == "__main__":
+    main()
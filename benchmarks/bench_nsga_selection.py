@@ -0,0 +1,87 @@
+"""
+NSGA-II seçim benchmark'ı: DEAP `tools.selNSGA2` ile NumPy tabanlı
+`sel_nsga2` / `sel_nsga3` karşılaştırması.
+
+Seçim adımı tek başına ölçülür: nesil başına 2·pop farklı bireyden (ebeveyn +
+yavru havuzu) pop birey seçme süresi ve bunun izin verdiği en yüksek nesil/sn.
+Amaç değerleri birbirinden farklıdır; 10 düğümlü varsayılan grafta bireylerin
+çoğu aynı rotaya düştüğünden DEAP'in aynı uygunlukları gruplaması O(N²)
+maliyeti gizler, uçtan uca süre ise değerlendirme ve hall-of-fame ile dolar.
+
+Kullanım:
+    python benchmarks/bench_nsga_selection.py
+    python benchmarks/bench_nsga_selection.py --sizes 100 1000 2000 --max-deap-pop 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from deap import creator, tools  # noqa: E402
+
+from nsga_selection import sel_nsga2, sel_nsga3  # noqa: E402
+from nsga_solver import _ensure_deap_classes  # noqa: E402
+
+SELECTORS = {
+    "deap": tools.selNSGA2,
+    "nsga2": sel_nsga2,
+    "nsga3": sel_nsga3,
+}
+
+
+def random_individuals(n: int, seed: int = 0):
+    """Amaçları (süre, maliyet, aktarma) birbirinden farklı n DEAP bireyi."""
+    _ensure_deap_classes()
+    rng = random.Random(seed)
+    individuals = []
+    for i in range(n):
+        ind = creator.Individual([f"N{i}"])
+        ind.fitness.values = (rng.uniform(10, 120), rng.uniform(0, 50), rng.randint(0, 5))
+        individuals.append(ind)
+    return individuals
+
+
+def bench_select(size: int, selection: str) -> float:
+    """2·size bireyden size birey seçme süresi (sn)."""
+    individuals = random_individuals(2 * size)
+    t0 = time.perf_counter()
+    SELECTORS[selection](individuals, size)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3, help="her ölçümün en iyisi alınır")
+    parser.add_argument(
+        "--max-deap-pop",
+        type=int,
+        default=2000,
+        help="Bu boyuttan büyük popülasyonlarda DEAP ölçümünü atla (çok yavaş)",
+    )
+    args = parser.parse_args()
+
+    print("Seçim adımı: 2·pop bireyden pop seçim")
+    print(f"{'pop':>7} {'seçim':>7} {'sn/nesil':>10} {'nesil/sn':>10} {'DEAP/bu':>8}")
+    for size in args.sizes:
+        t_deap = None
+        for selection in SELECTORS:
+            if selection == "deap" and size > args.max_deap_pop:
+                print(f"{size:>7} {selection:>7} {'atlandı':>10}")
+                continue
+            repeat = 1 if selection == "deap" and size >= 1000 else args.repeat
+            t = min(bench_select(size, selection) for _ in range(repeat))
+            if selection == "deap":
+                t_deap = t
+            ratio = f"{t_deap / t:7.1f}x" if t_deap is not None else f"{'-':>8}"
+            print(f"{size:>7} {selection:>7} {t:>10.3f} {1 / t:>10.2f} {ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Çizim benchmark'ı (Agg backend): ~10k / 100k / 1M kenarlı yapay şehirlerde
+draw_graph_fast render süresi (LOD sınırı ile, sınırsız ve görünür alanın
+dörtte biriyle); küçük graflarda eski yol draw_graph (DiGraph üzerinde kenar
+başına FancyArrowPatch) ile karşılaştırma ve önbellekli temel katman üstüne
+rota çizme süresi.
+
+Kullanım:
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --sizes 10000 100000 --max-edges 100000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import matplotlib.pyplot as plt  # noqa: E402
+import networkx as nx  # noqa: E402
+
+from utils import synthetic_city_graph  # noqa: E402
+from visualization import draw_graph, draw_graph_fast, overlay_route, render_arrays  # noqa: E402
+
+
+def city_for_edges(n_edges: int):
+    """Yaklaşık n_edges kenarlı yapay şehir (kare ızgara, düğüm başına ~4 kenar)."""
+    side = max(2, round(math.sqrt(n_edges / 4)))
+    return synthetic_city_graph(side, side)
+
+
+def _render(draw) -> float:
+    """Yeni bir figürde draw(ax) çağırıp tam render süresini ölçer."""
+    fig, ax = plt.subplots(figsize=(8, 8), dpi=100)
+    t0 = time.perf_counter()
+    draw(ax)
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - t0
+    plt.close(fig)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-edges", type=int, default=200_000)
+    parser.add_argument(
+        "--baseline-max",
+        type=int,
+        default=20_000,
+        help="draw_graph (kenar başına artist) yalnızca bu kenar sayısına kadar ölçülür",
+    )
+    args = parser.parse_args()
+
+    header = (
+        f"{'kenar':>10} {'draw_graph':>11} {'fast LOD':>9} {'fast tam':>9}"
+        f" {'görünür 1/4':>12} {'hızlanma':>9}"
+    )
+    print(header + "   (render süresi, sn)")
+    G = None
+    for n in args.sizes:
+        G = city_for_edges(n)
+        m = G.number_of_edges()
+        render_arrays(G)  # dizi hazırlığı bir kez; çizim süresine katılmaz
+        xy = render_arrays(G)["xy"]
+        x0, y0 = xy.min(axis=0)
+        x1, y1 = xy.max(axis=0)
+        quarter = (x0, (x0 + x1) / 2, y0, (y0 + y1) / 2)
+
+        t_lod = _render(lambda ax: draw_graph_fast(G, ax=ax, max_edges=args.max_edges))
+        t_full = _render(lambda ax: draw_graph_fast(G, ax=ax, max_edges=None))
+        t_view = _render(
+            lambda ax: draw_graph_fast(G, ax=ax, viewport=quarter, max_edges=args.max_edges)
+        )
+        if m <= args.baseline_max:
+            t_old = _render(lambda ax: draw_graph(G, ax=ax, show_labels=False))
+            old, gain = f"{t_old:11.3f}", f"{t_old / t_full:8.1f}x"
+        else:
+            old, gain = f"{'-':>11}", f"{'-':>9}"
+        print(f"{m:>10,} {old} {t_lod:9.3f} {t_full:9.3f} {t_view:12.3f} {gain}")
+
+    # Önbellekli temel katman üstüne rota (en büyük graf)
+    fig, ax = plt.subplots(figsize=(8, 8), dpi=100)
+    layer = draw_graph_fast(G, ax=ax, max_edges=args.max_edges)
+    nodes = list(G.nodes())
+    path = nx.shortest_path(G, nodes[0], nodes[-1], weight="travel_time")
+    overlay_route(layer, path)  # ilk çağrı temel katmanı önbelleğe alır
+
+    t0 = time.perf_counter()
+    for _ in range(10):
+        overlay_route(layer, path)
+    t_overlay = (time.perf_counter() - t0) / 10
+    plt.close(fig)
+    print(
+        f"\n{G.number_of_edges():,} kenar, önbellekli temel katman + rota: "
+        f"{t_overlay * 1e3:.1f} ms/rota"
+    )
+
+if __name__ == "__main__":
+    main()
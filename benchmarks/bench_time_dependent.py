@@ -0,0 +1,117 @@
+"""
+Zamana bağlı süre profilleri benchmark'ı: kenar başına bellek (paylaşılan
+diziler vs. kenar başına Python listesi), statik / zamana bağlı A* gecikmesi
+ve zamana bağlı A*'ın use_heuristic=False (Dijkstra) ile aynı varışı verdiği.
+
+Kullanım:
+    python benchmarks/bench_time_dependent.py --rows 100 --cols 100 --breakpoints 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(BASE_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+import networkx as nx  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from astar_solver import solve_astar_constrained, solve_astar_time_dependent  # noqa: E402
+from graph_builder import DAY_MINUTES, attach_time_profiles  # noqa: E402
+from utils import synthetic_city_graph  # noqa: E402
+
+
+def synthetic_profiles(G, n_breakpoints: int, seed: int = 0) -> pd.DataFrame:
+    """Her kenar için FIFO koşulunu sağlayan rastgele zirve profilleri."""
+    rng = random.Random(seed)
+    step = DAY_MINUTES / n_breakpoints
+    rows = []
+    for u, v, data in G.edges(data=True):
+        base = data["travel_time"]
+        for i in range(n_breakpoints):
+            # artış/azalış eğimi |Δd / Δt| < 1 kalacak şekilde sınırlı
+            factor = 1.0 + rng.random() * min(1.0, 0.9 * step / max(base, 1e-9))
+            rows.append((u, v, i * step, base * factor))
+    return pd.DataFrame(rows, columns=["from", "to", "time_min", "travel_time_min"])
+
+
+def deep_sizeof_lists(G) -> int:
+    """Karşılaştırma: profilleri kenar başına [(t, d), ...] listesi olarak tutmanın maliyeti."""
+    prof = G.graph["td_profiles"]
+    times, values, offsets = prof["times"], prof["values"], prof["offsets"]
+    total = 0
+    for i in range(len(offsets) - 1):
+        pts = [(float(times[j]), float(values[j])) for j in range(offsets[i], offsets[i + 1])]
+        total += sys.getsizeof(pts)
+        total += sum(sys.getsizeof(p) + 2 * sys.getsizeof(p[0]) for p in pts)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--breakpoints", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    G = synthetic_city_graph(args.rows, args.cols)
+    n_edges = G.number_of_edges()
+    print(f"Graf: {G.number_of_nodes()} düğüm, {n_edges} kenar")
+
+    t0 = time.perf_counter()
+    attach_time_profiles(G, synthetic_profiles(G, args.breakpoints))
+    print(f"Profil yükleme: {time.perf_counter() - t0:.2f} sn")
+
+    prof = G.graph["td_profiles"]
+    array_bytes = sum(len(prof[k]) * prof[k].itemsize for k in ("times", "values", "offsets"))
+    list_bytes = deep_sizeof_lists(G)
+    print(f"Bellek / kenar (paylaşılan diziler): {array_bytes / n_edges:.1f} B")
+    print(f"Bellek / kenar (Python listeleri):   {list_bytes / n_edges:.1f} B")
+
+    rng = random.Random(0)
+    nodes = list(G.nodes())
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(args.queries)]
+
+    t0 = time.perf_counter()
+    for s, g in pairs:
+        solve_astar_constrained(G, s, g)
+    static_ms = (time.perf_counter() - t0) / len(pairs) * 1e3
+
+    # eşdeğer karşılaştırma: statik A*'ın heuristic'i süreyi aşırı tahmin edebilir
+    t0 = time.perf_counter()
+    for s, g in pairs:
+        nx.dijkstra_path_length(G, s, g, weight="travel_time")
+    static_dijkstra_ms = (time.perf_counter() - t0) / len(pairs) * 1e3
+
+    t0 = time.perf_counter()
+    td = [
+        solve_astar_time_dependent(G, s, g, departure_min=480.0, use_heuristic=True)[1]
+        for s, g in pairs
+    ]
+    td_ms = (time.perf_counter() - t0) / len(pairs) * 1e3
+
+    t0 = time.perf_counter()
+    ref = [
+        solve_astar_time_dependent(G, s, g, departure_min=480.0, use_heuristic=False)[1]
+        for s, g in pairs
+    ]
+    dijkstra_ms = (time.perf_counter() - t0) / len(pairs) * 1e3
+
+    mismatches = sum(
+        1 for a, b in zip(td, ref) if (a is None) != (b is None) or (a is not None and abs(a - b) > 1e-6)
+    )
+
+    print(f"Statik A*:                 {static_ms:.2f} ms/sorgu")
+    print(f"Statik Dijkstra:           {static_dijkstra_ms:.2f} ms/sorgu")
+    print(f"Zamana bağlı A*:           {td_ms:.2f} ms/sorgu")
+    print(f"Zamana bağlı Dijkstra:     {dijkstra_ms:.2f} ms/sorgu")
+    print(f"A* / Dijkstra varış farkı: {mismatches}/{len(pairs)} sorgu")
+
+
+if __name__ == "__main__":
+    main()
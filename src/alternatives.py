@@ -0,0 +1,419 @@
+"""
+Alternatif rota üretimi (k-en kısa / via-node).
+
+İki yöntem:
+  - Yen'in k-en kısa döngüsüz yolları: spur aramaları, hedeften geriye
+    hesaplanan tek bir en kısa yol ağacını A* heuristic'i olarak kullanır.
+    Kenar/düğüm çıkarmak mesafeyi yalnızca artırabildiği için bu heuristic
+    tutarlıdır; ağaçtaki yol yasaklara takılmıyorsa spur doğrudan odur.
+  - Via-node / plateau: başlangıçtan ileri ve hedeften geri iki ağaç bir kez
+    hesaplanır; her düğüm "s -> v -> t" adayıdır. İki ağacın ortak kenarları
+    (plateau) uzun olan adaylar tercih edilir, böylece farklı koridorlardan
+    geçen alternatifler bulunur.
+
+Ağaçlar scipy.sparse.csgraph ile hesaplanır. İki yöntem de (1 + max_stretch)
+· en kısa sınırının üstündeki rotaları aramadan budar: spur aramaları bu
+sınırla kesilir, via-node'un ileri ağacı ise geri ağaç mesafeleriyle
+indirgenmiş ağırlıklar üzerinde yalnızca sınır içindeki "elips" bölgeyi tarar.
+
+Sonuçlar `path_stats` biçimindedir; ek olarak "path" ve "weight" alanları vardır.
+"""
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from utils import load_default_graph, path_stats
+
+
+INF = math.inf
+ALL_MODES = {"metro", "bus", "train", "walk", "bike", "car"}
+
+
+# -----------------------------
+#  Graf derleme ve temel aramalar
+# -----------------------------
+def compile_graph(G: nx.DiGraph, allowed_modes=None, weight: str = "travel_time") -> Dict[str, Any]:
+    """
+    Mod filtresi uygulanmış, indeks tabanlı ileri/geri komşuluk listeleri
+    ve ağaç aramaları için CSR matrisleri (ileri ve ters).
+    Aynı mod kümesiyle çok sayıda sorgu yapılacaksa bir kez derleyip
+    `compiled=` parametresiyle tekrar kullanın.
+    """
+    allowed_modes = ALL_MODES if allowed_modes is None else set(allowed_modes)
+
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    adj: List[List[Tuple[int, float]]] = [[] for _ in nodes]
+    radj: List[List[Tuple[int, float]]] = [[] for _ in nodes]
+    tails, heads, weights = [], [], []
+
+    for u, v, data in G.edges(data=True):
+        if data["mode"] not in allowed_modes:
+            continue
+        w = float(data[weight])
+        adj[index[u]].append((index[v], w))
+        radj[index[v]].append((index[u], w))
+        tails.append(index[u])
+        heads.append(index[v])
+        weights.append(w)
+
+    n = len(nodes)
+    csr = csr_matrix((weights, (tails, heads)), shape=(n, n))
+    return {
+        "nodes": nodes,
+        "index": index,
+        "adj": adj,
+        "radj": radj,
+        "weight": weight,
+        "csr": csr,
+        "csr_t": csr.T.tocsr(),
+        "csr_tail": np.repeat(np.arange(n), np.diff(csr.indptr)),
+    }
+
+
+def _tree(matrix: csr_matrix, source: int, limit: float = INF) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dijkstra ağacı: (mesafe, ebeveyn) dizileri; ulaşılamayan (veya `limit`
+    ötesindeki) düğümler = inf / negatif.
+    Ters matrisle çağrıldığında ebeveyn, hedefe doğru bir sonraki düğümdür.
+    """
+    return dijkstra(matrix, indices=source, return_predecessors=True, limit=limit)
+
+
+def _spur_search(
+    adj: List[List[Tuple[int, float]]],
+    source: int,
+    goal: int,
+    h: List[float],
+    succ: List[int],
+    banned_nodes: Set[int],
+    banned_edges: Set[Tuple[int, int]],
+    bound: float = INF,
+) -> Optional[Tuple[float, List[int]]]:
+    """
+    Yasaklı düğüm/kenarlarla A*; h = hedefe olan tam-graf mesafesi, succ =
+    aynı ağaçta hedefe doğru sonraki düğüm. Ağırlığı `bound`u aşacak
+    rotalar aranmaz.
+    """
+    if h[source] == INF or h[source] > bound:
+        return None
+
+    # ağaçtaki yol yasaklara takılmıyorsa en kısa spur odur (h kesin mesafe)
+    nxt = succ[source]
+    if (source, nxt) not in banned_edges:
+        path = [source]
+        while path[-1] != goal and path[-1] >= 0 and path[-1] not in banned_nodes:
+            path.append(succ[path[-1]])
+        if path[-1] == goal:
+            return h[source], path
+
+    g = {source: 0.0}
+    parent = {source: -1}
+    # eşit f'lerde derin düğüm önce: kesin heuristic ile hedefe düz ilerler
+    heap = [(h[source], -0.0, source)]
+
+    while heap:
+        _, neg_d, u = heapq.heappop(heap)
+        d = -neg_d
+        if d > g[u]:
+            continue
+        if u == goal:
+            path = [u]
+            while parent[path[-1]] != -1:
+                path.append(parent[path[-1]])
+            path.reverse()
+            return d, path
+        for v, w in adj[u]:
+            if v in banned_nodes or (u, v) in banned_edges or h[v] == INF:
+                continue
+            nd = d + w
+            if nd + h[v] > bound:
+                continue
+            if nd < g.get(v, INF):
+                g[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd + h[v], -nd, v))
+
+    return None
+
+
+def _edge_weights(adj, path: List[int]) -> List[float]:
+    """Rota üzerindeki ardışık kenarların ağırlıkları."""
+    weights = []
+    for u, v in zip(path[:-1], path[1:]):
+        weights.append(min(w for x, w in adj[u] if x == v))
+    return weights
+
+
+def _overlap(edge_w: Dict[Tuple[int, int], float], weight: float, other: Set[Tuple[int, int]]) -> float:
+    """Adayın ağırlığının ne kadarının başka bir rotayla paylaşıldığı (0..1)."""
+    if weight <= 0:
+        return 1.0 if set(edge_w) & other else 0.0
+    shared = sum(w for e, w in edge_w.items() if e in other)
+    return shared / weight
+
+
+def _accept(
+    path: List[int],
+    weights: List[float],
+    accepted: List[Dict[str, Any]],
+    max_overlap: Optional[float],
+) -> Optional[Dict[str, Any]]:
+    """Örtüşme sınırını sağlıyorsa adayı kabul listesine uygun biçimde döndürür."""
+    edge_w = dict(zip(zip(path[:-1], path[1:]), weights))
+    total = sum(weights)
+    if max_overlap is not None:
+        for a in accepted:
+            if _overlap(edge_w, total, a["edges"]) > max_overlap:
+                return None
+    return {"nodes": path, "weight": total, "edges": set(edge_w)}
+
+
+def _to_results(G: nx.DiGraph, compiled, accepted) -> List[Dict[str, Any]]:
+    """İndeks rotalarını orijinal düğüm id'lerine çevirip path_stats ile zenginleştirir."""
+    nodes = compiled["nodes"]
+    results = []
+    for a in accepted:
+        path = [nodes[i] for i in a["nodes"]]
+        stats = path_stats(G, path)
+        stats["path"] = path
+        stats["weight"] = a["weight"]
+        results.append(stats)
+    return results
+
+
+# -----------------------------
+#  Yen'in k-en kısa yolları
+# -----------------------------
+def k_shortest_paths(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    k: int = 5,
+    allowed_modes=None,
+    weight: str = "travel_time",
+    max_overlap: Optional[float] = None,
+    compiled: Optional[Dict[str, Any]] = None,
+    max_candidates: Optional[int] = None,
+    max_stretch: Optional[float] = 0.5,
+) -> List[Dict[str, Any]]:
+    """
+    Yen'in algoritmasıyla en fazla k döngüsüz rota (ağırlığa göre artan).
+
+    max_overlap verilirse (ör. 0.7), önceden kabul edilmiş bir rotayla
+    ağırlığının bu oranından fazlasını paylaşan rotalar atlanır; atlanan
+    rotalar yine de yeni sapmalar üretmek için kullanılır.
+    max_candidates: incelenecek toplam rota sayısı sınırı (varsayılan 10·k).
+    max_stretch: en kısa rotadan en fazla bu oranda uzun rotalar (0.5 = %50);
+    None ise sınırsız (klasik Yen, k rota yoksa daha azı döner).
+    """
+    if compiled is None:
+        compiled = compile_graph(G, allowed_modes, weight)
+    adj = compiled["adj"]
+    s = compiled["index"][start]
+    t = compiled["index"][goal]
+    max_candidates = max_candidates or 10 * k
+
+    # hedefe olan mesafeler: tüm spur aramaları için ortak heuristic
+    db, succ_b = _tree(compiled["csr_t"], t)
+    if db[s] == INF:
+        return []
+    h, succ = db.tolist(), succ_b.tolist()
+    limit = INF if max_stretch is None else h[s] * (1.0 + max_stretch)
+
+    first = [s]
+    while first[-1] != t:
+        first.append(succ[first[-1]])
+
+    found: List[Tuple[List[int], int]] = []  # (rota, sapma indeksi)
+    seen = {tuple(first)}
+    accepted: List[Dict[str, Any]] = []
+    # Aday yığını: (anahtar, sayaç, rota, sapma indeksi, taban rota, önek ağırlığı).
+    # rota None ise "tembel" spur'dur: anahtar yalnızca bir alt sınırdır ve
+    # spur araması ancak yığının başına geldiğinde yapılır. k rota için
+    # dalların çoğu hiç aranmaz.
+    candidates: List[Tuple[float, int, Any, int, Any, float]] = [(h[s], 0, first, 0, None, 0.0)]
+    counter = 1
+
+    while candidates and len(accepted) < k and len(found) < max_candidates:
+        _, _, path, dev, base, base_prefix = heapq.heappop(candidates)
+
+        if path is None:
+            root = base[: dev + 1]
+            banned_edges = {
+                (p[dev], p[dev + 1]) for p, _ in found if len(p) > dev + 1 and p[: dev + 1] == root
+            }
+            spur = _spur_search(
+                adj, base[dev], t, h, succ, set(root[:-1]), banned_edges, bound=limit - base_prefix
+            )
+            if spur is None:
+                continue
+            spur_w, spur_path = spur
+            total = root[:-1] + spur_path
+            key = tuple(total)
+            if key in seen:
+                continue
+            seen.add(key)
+            heapq.heappush(candidates, (base_prefix + spur_w, counter, total, dev, None, 0.0))
+            counter += 1
+            continue
+
+        found.append((path, dev))
+        weights = _edge_weights(adj, path)
+        a = _accept(path, weights, accepted, max_overlap)
+        if a is not None:
+            accepted.append(a)
+
+        # Lawler: yalnızca sapma noktasından sonrası yeni dal üretir. Dalın alt
+        # sınırı: önek + rotanın kendi kenarı dışındaki en iyi (w + h) çıkışı.
+        prefix = sum(weights[:dev])
+        root_nodes = set(path[:dev])
+        for i in range(dev, len(path) - 1):
+            u, nxt = path[i], path[i + 1]
+            bound = INF
+            for v, w in adj[u]:
+                if v != nxt and v not in root_nodes and w + h[v] < bound:
+                    bound = w + h[v]
+            if prefix + bound <= limit:
+                heapq.heappush(candidates, (prefix + bound, counter, None, i, path, prefix))
+                counter += 1
+            root_nodes.add(u)
+            prefix += weights[i]
+
+    return _to_results(G, compiled, accepted)
+
+
+# -----------------------------
+#  Via-node / plateau alternatifleri
+# -----------------------------
+def via_node_alternatives(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    k: int = 5,
+    allowed_modes=None,
+    weight: str = "travel_time",
+    max_stretch: float = 0.5,
+    max_overlap: Optional[float] = 0.7,
+    compiled: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Via-node yöntemiyle birbirinden farklı en fazla k rota.
+
+    max_stretch: en kısa rotaya göre izin verilen fazlalık (0.5 = %50 daha uzun).
+    Adaylar (uzunluk - plateau uzunluğu) değerine göre sıralanır; yani
+    "yerel olarak en kısa" kısmı uzun olan rotalar öne çıkar.
+    """
+    if compiled is None:
+        compiled = compile_graph(G, allowed_modes, weight)
+    adj = compiled["adj"]
+    s = compiled["index"][start]
+    t = compiled["index"][goal]
+
+    db, succ_b = _tree(compiled["csr_t"], t)
+    opt = db[s]
+    if opt == INF:
+        return []
+
+    # İleri ağaç, geri mesafelerle indirgenmiş ağırlıklarla (w - db[u] + db[v] >= 0)
+    # aranır: indirgenmiş mesafe = df[v] + db[v] - opt, yani limit = max_stretch·opt
+    # yalnızca df + db <= (1 + max_stretch)·opt olan düğümleri tarar.
+    csr = compiled["csr"]
+    with np.errstate(invalid="ignore"):
+        reduced = csr.data - db[compiled["csr_tail"]] + db[csr.indices]
+    reduced = np.where(np.isfinite(reduced), np.maximum(reduced, 0.0), INF)
+    slack = opt * max_stretch
+    dr, parent_f = _tree(
+        csr_matrix((reduced, csr.indices, csr.indptr), shape=csr.shape),
+        s,
+        limit=slack * (1.0 + 1e-9) + 1e-9,
+    )
+
+    cand = np.flatnonzero(dr <= slack * (1.0 + 1e-9) + 1e-9)
+    with np.errstate(invalid="ignore"):
+        df = dr + (opt - db)
+    total = dr + opt
+
+    # plateau: ileri ağaçtaki (p -> v) kenarı geri ağaçta da p'nin halefi ise
+    # zincir sürer; v'nin plateau'su df[v] - df[zincirin başı]. Zincir başları
+    # işaretçi atlamayla (pointer jumping) bulunur.
+    p = parent_f[cand]
+    on = p >= 0
+    on[on] = succ_b[p[on]] == cand[on]
+    anc = np.arange(len(dr))
+    anc[cand[on]] = p[on]
+    while True:
+        nxt = anc[anc]
+        if np.array_equal(nxt, anc):
+            break
+        anc = nxt
+    plateau = df[cand] - df[anc[cand]]
+    scored = cand[np.lexsort((df[cand], total[cand], total[cand] - plateau))].tolist()
+    parent_f, succ_b = parent_f.tolist(), succ_b.tolist()
+
+    accepted: List[Dict[str, Any]] = []
+    on_accepted: Set[int] = set()
+    seen: Set[Tuple[int, ...]] = set()
+
+    for v in scored:
+        if len(accepted) >= k:
+            break
+        if v in on_accepted and accepted:
+            continue  # bu düğüm zaten kabul edilmiş bir rotanın üzerinde
+
+        head = [v]
+        while head[-1] != s:
+            head.append(parent_f[head[-1]])
+        head.reverse()
+        tail = [v]
+        while tail[-1] != t:
+            tail.append(succ_b[tail[-1]])
+        path = head + tail[1:]
+
+        key = tuple(path)
+        if key in seen or len(set(path)) != len(path):
+            continue  # tekrar eden ya da döngülü aday
+        seen.add(key)
+
+        a = _accept(path, _edge_weights(adj, path), accepted, max_overlap if accepted else None)
+        if a is None:
+            continue
+        accepted.append(a)
+        on_accepted.update(path)
+
+    accepted.sort(key=lambda a: a["weight"])
+    return _to_results(G, compiled, accepted)
+
+
+def alternative_routes(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    k: int = 5,
+    method: str = "yen",
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """method = "yen" (k-en kısa) veya "via" (via-node / plateau)."""
+    if method == "yen":
+        return k_shortest_paths(G, start, goal, k=k, **kwargs)
+    if method == "via":
+        return via_node_alternatives(G, start, goal, k=k, **kwargs)
+    raise ValueError(f"Bilinmeyen alternatif yöntemi: {method}")
+
+
+if __name__ == "__main__":
+    G = load_default_graph()
+
+    for method in ("yen", "via"):
+        print(f"=== {method} ===")
+        for i, r in enumerate(alternative_routes(G, "N6", "N8", k=5, method=method), start=1):
+            print(
+                f"{i}. {' -> '.join(r['path'])} | "
+                f"Süre: {r['total_time']} dk, Maliyet: {r['total_cost']} TL, "
+                f"Aktarma: {r['transfers']}"
+            )
@@ -1,7 +1,7 @@
 import math
 import heapq
 import networkx as nx
-from graph_builder import build_graph
+from graph_builder import build_graph, td_edge_time, td_min_speed
 
 
 def heuristic(G: nx.DiGraph, u: str, v: str) -> float:
@@ -102,6 +102,90 @@ def solve_astar_constrained(
     return None, None, None
 
 
+def solve_astar_time_dependent(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    departure_min: float,
+    allowed_modes=None,
+    use_heuristic: bool = False,
+):
+    """
+    Zamana bağlı A*: `departure_min` (gün içi dakika, ör. 08:00 -> 480) anında
+    start'tan çıkıp en erken goal'a varan rotayı bulur. Kenar süreleri
+    td_edge_time ile o kenara varış anına göre hesaplanır.
+
+    Profiller FIFO olduğundan bir düğüme daha erken varmak hiçbir zaman
+    zarar vermez; bu yüzden her düğüm tek bir (en erken) etiketle kesinleşir.
+    Bunun doğru olması için heuristic tutarlı olmalıdır: `heuristic()` süreyi
+    aşırı tahmin edebildiği için burada veriden çıkarılan alt sınır
+    (öklid mesafe * td_min_speed) kullanılır. Sonuç use_heuristic=False
+    (düz zamana bağlı Dijkstra) ile aynı varış süresini verir.
+
+    Alt sınır gevşek olduğundan (en hızlı mod, en yoğun olmayan saat) A*
+    çoğu sorguda Dijkstra'dan az düğüm açar ama düğüm başına heuristic
+    maliyeti bunu dengeler; bu yüzden varsayılan use_heuristic=False'tur.
+    Hız sınırı profil yüklenirken (attach_time_profiles) ya da profilsiz
+    graflarda ilk sorguda bir kez hesaplanır ve G.graph'ta saklanır.
+
+    (path, toplam süre, toplam maliyet) döner; rota yoksa (None, None, None).
+    """
+    if allowed_modes is None:
+        allowed_modes = {"metro", "bus", "train", "walk", "bike", "car"}
+    else:
+        allowed_modes = set(allowed_modes)
+
+    prof = G.graph.get("td_profiles")
+    speed = 0.0
+    if use_heuristic:
+        if prof is not None:
+            speed = prof["min_speed"]
+        else:
+            speed = G.graph.get("td_min_speed")
+            if speed is None:
+                speed = G.graph["td_min_speed"] = td_min_speed(G)
+    gx, gy = G.nodes[goal]["x"], G.nodes[goal]["y"]
+
+    def h(n):
+        if speed == 0.0:
+            return 0.0
+        data = G.nodes[n]
+        return math.hypot(data["x"] - gx, data["y"] - gy) * speed
+
+    # (f, varış zamanı, node)
+    open_list = [(departure_min + h(start), departure_min, start)]
+    arrival = {start: departure_min}
+    parent = {start: None}
+    cost = {start: 0.0}
+    closed = set()
+
+    while open_list:
+        _, t_node, node = heapq.heappop(open_list)
+        if node in closed:
+            continue
+        closed.add(node)
+
+        if node == goal:
+            path = [node]
+            while parent[path[-1]] is not None:
+                path.append(parent[path[-1]])
+            path.reverse()
+            return path, t_node - departure_min, cost[node]
+
+        for neighbor, edge_data in G.adj[node].items():
+            if edge_data["mode"] not in allowed_modes or neighbor in closed:
+                continue
+
+            t_new = t_node + td_edge_time(prof, edge_data, t_node)
+            if t_new < arrival.get(neighbor, math.inf):
+                arrival[neighbor] = t_new
+                parent[neighbor] = node
+                cost[neighbor] = cost[node] + edge_data["cost"]
+                heapq.heappush(open_list, (t_new + h(neighbor), t_new, neighbor))
+
+    return None, None, None
+
+
 if __name__ == "__main__":
     G = build_graph("data/nodes.csv", "data/edges.csv")
 
@@ -156,3 +240,14 @@ if __name__ == "__main__":
         print(f"Süre: {t} dk, Maliyet: {c} TL")
     else:
         print("Uygun rota bulunamadı (kısıtlardan dolayı).")
+
+    # Örnek 4: Zamana bağlı süreler (sabah zirvesi 08:30 vs. öğle 13:00)
+    G_td = build_graph("data/nodes.csv", "data/edges.csv", "data/edge_profiles.csv")
+    for label, dep in (("08:30", 510.0), ("13:00", 780.0)):
+        p, t, c = solve_astar_time_dependent(G_td, "N6", "N8", departure_min=dep)
+        print(f"\n[4] Zamana bağlı A*, kalkış {label}:")
+        if p:
+            print("Rota:", " -> ".join(p))
+            print(f"Süre: {t:.1f} dk, Maliyet: {c} TL")
+        else:
+            print("Uygun rota bulunamadı.")
@@ -0,0 +1,522 @@
+"""
+JSONL dosyasındaki rota sorgularını toplu (batch) çalıştırır.
+
+Her satır bir sorgudur, örnek:
+    {"id": "q1", "algorithm": "astar", "start": "N6", "goal": "N8",
+     "modes": ["bus", "metro", "walk"], "max_time": 60, "max_cost": 30}
+
+Desteklenen algoritmalar: astar, astar_simple, raptor, nsga2.
+
+Kullanım:
+    python src/batch_runner.py queries.jsonl -o results.jsonl --workers 4
+    python src/batch_runner.py queries.jsonl -o results_parquet --format parquet
+    python src/batch_runner.py queries.jsonl -o results.jsonl --resume
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import networkx as nx
+
+from graph_builder import build_graph
+from registry import get_solver
+from utils import DATA_DIR, path_stats
+
+
+# Parquet çıktısında sabit tutulan kolonlar (şema parçadan parçaya değişmesin)
+RESULT_COLUMNS = [
+    "line",
+    "id",
+    "algorithm",
+    "start",
+    "goal",
+    "found",
+    "path",
+    "total_time",
+    "total_cost",
+    "total_distance",
+    "transfers",
+    "solutions",
+    "error",
+]
+
+# iter_queries'in çözümlenemeyen satırlar için kullandığı anahtar
+PARSE_ERROR = "__parse_error__"
+
+# Her worker sürecinde bir kez yüklenen graf
+_WORKER_GRAPH: nx.DiGraph | None = None
+
+
+# -----------------------------
+#  Worker tarafı
+# -----------------------------
+def _init_worker(nodes_path: str, edges_path: str):
+    """Process pool initializer: grafı her worker'da yalnızca bir kez yükler."""
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = build_graph(nodes_path, edges_path)
+
+
+def _route_record(G: nx.DiGraph, path: Optional[List[str]]) -> Dict[str, Any]:
+    """Tek rotalı algoritmalar için ortak sonuç alanlarını üretir."""
+    if not path:
+        return {"found": False, "path": None}
+
+    stats = path_stats(G, path)
+    return {
+        "found": True,
+        "path": path,
+        "total_time": stats["total_time"],
+        "total_cost": stats["total_cost"],
+        "total_distance": stats["total_distance"],
+        "transfers": stats["transfers"],
+    }
+
+
+def run_query(G: nx.DiGraph, query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Tek bir sorguyu ilgili algoritmaya yönlendirir ve sonuç kaydını döndürür.
+    Algoritma modülleri registry üzerinden ilk kullanımda yüklenir.
+    """
+    algorithm = query.get("algorithm", "astar")
+    start = query["start"]
+    goal = query["goal"]
+
+    if algorithm == "astar":
+        path, _, _ = get_solver("astar")(
+            G,
+            start,
+            goal,
+            allowed_modes=query.get("modes"),
+            max_cost=query.get("max_cost"),
+            max_time=query.get("max_time"),
+        )
+        return _route_record(G, path)
+
+    if algorithm == "astar_simple":
+        try:
+            path, _, _ = get_solver("astar_simple")(G, start, goal)
+        except nx.NetworkXNoPath:
+            path = None
+        return _route_record(G, path)
+
+    if algorithm == "raptor":
+        raptor_like = get_solver("raptor")
+        path, _ = raptor_like(G, start, goal, max_rounds=int(query.get("max_rounds", 3)))
+        return _route_record(G, path)
+
+    if algorithm == "nsga2":
+        sols = get_solver("nsga2")(
+            G,
+            start,
+            goal,
+            n_generations=int(query.get("n_generations", 40)),
+            pop_size=int(query.get("pop_size", 40)),
+            max_intermediate_len=int(query.get("max_intermediate_len", 4)),
+            verbose=False,
+        )
+        return {
+            "found": bool(sols),
+            "solutions": [
+                {
+                    "full_path": s["full_path"],
+                    "total_time": s["total_time"],
+                    "total_cost": s["total_cost"],
+                    "transfers": s["transfers"],
+                }
+                for s in sols
+            ],
+        }
+
+    raise ValueError(f"Bilinmeyen algoritma: {algorithm}")
+
+
+def _run_chunk(chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Worker'da bir grup sorguyu çalıştırır; hatalar kayda yazılır, süreci düşürmez."""
+    assert _WORKER_GRAPH is not None, "Worker grafı yüklenmedi."
+
+    records = []
+    for line_no, query in chunk:
+        if PARSE_ERROR in query:
+            records.append({"line": line_no, "found": False, "error": query[PARSE_ERROR]})
+            continue
+
+        record = {
+            "line": line_no,
+            "id": query.get("id"),
+            "algorithm": query.get("algorithm", "astar"),
+            "start": query.get("start"),
+            "goal": query.get("goal"),
+        }
+        try:
+            record.update(run_query(_WORKER_GRAPH, query))
+        except Exception as exc:  # sorgu hatası tüm batch'i durdurmasın
+            record["found"] = False
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        records.append(record)
+    return records
+
+
+# -----------------------------
+#  Girdi / çıktı
+# -----------------------------
+def iter_queries(path: str, skip: Set[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    JSONL dosyasını satır satır okur; boş ve tamamlanmış satırları atlar.
+    Bozuk satırlar batch'i durdurmaz: {PARSE_ERROR: mesaj} olarak iletilir
+    ve worker tarafında hata kaydına dönüşür.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if line_no in skip or not line.strip():
+                continue
+            try:
+                query = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield line_no, {PARSE_ERROR: f"JSONDecodeError: {exc}"}
+                continue
+            if not isinstance(query, dict):
+                query = {PARSE_ERROR: f"TypeError: sorgu bir JSON nesnesi olmalı ({type(query).__name__})"}
+            yield line_no, query
+
+
+def iter_chunks(queries, chunk_size: int):
+    """Sorguları worker'a gönderilecek küçük gruplara böler."""
+    chunk = []
+    for item in queries:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def completed_lines(output: str, fmt: str) -> Set[int]:
+    """
+    Önceki çalıştırmada başarıyla sonuçlanmış satır numaralarını bulur (resume
+    için). Hata kaydı olan satırlar (bozuk JSON, sorgu/worker hatası)
+    tamamlanmış sayılmaz; resume onları yeniden dener.
+    """
+    done: Set[int] = set()
+
+    if fmt == "jsonl":
+        if not os.path.exists(output):
+            return done
+        with open(output, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if not record.get("error"):
+                        done.add(int(record["line"]))
+                except (ValueError, KeyError, AttributeError):
+                    # yarım yazılmış son satır: yeniden çalıştırılacak
+                    continue
+        return done
+
+    if not os.path.isdir(output):
+        return done
+
+    import pandas as pd
+
+    for name in sorted(os.listdir(output)):
+        if name.endswith(".parquet"):
+            part = pd.read_parquet(os.path.join(output, name), columns=["line", "error"])
+            done.update(int(x) for x in part.loc[part["error"].isna(), "line"])
+    return done
+
+
+def drop_failed_rows(output: str, fmt: str) -> int:
+    """
+    Resume öncesi hata kayıtlarını çıktıdan siler; yeniden denenen satırlar
+    böylece çıktıda iki kez görünmez. Silinen kayıt sayısını döndürür.
+    JSONL dosyası yeniden yazılır; parquet'te yalnızca hata içeren parçalar
+    (numaralandırma bozulmasın diye boş kalsalar bile) yerinde yeniden yazılır.
+    """
+    dropped = 0
+
+    if fmt == "jsonl":
+        if not os.path.exists(output):
+            return 0
+        tmp = output + ".tmp"
+        with open(output, "r", encoding="utf-8") as src, open(tmp, "w", encoding="utf-8") as dst:
+            for line in src:
+                try:
+                    failed = bool(json.loads(line).get("error"))
+                except (ValueError, AttributeError):
+                    continue  # yarım yazılmış satır
+                if failed:
+                    dropped += 1
+                else:
+                    dst.write(line if line.endswith("\n") else line + "\n")
+        os.replace(tmp, output)
+        return dropped
+
+    if not os.path.isdir(output):
+        return 0
+
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    for name in sorted(os.listdir(output)):
+        if not name.endswith(".parquet"):
+            continue
+        path = os.path.join(output, name)
+        table = pq.read_table(path)
+        ok = table.filter(pc.is_null(table["error"]))
+        if ok.num_rows < table.num_rows:
+            dropped += table.num_rows - ok.num_rows
+            pq.write_table(ok, path)
+    return dropped
+
+
+def _drop_partial_tail(path: str):
+    """Yarıda kesilmiş son satırı siler ki eklenen kayıtlar bozuk satıra yapışmasın."""
+    with open(path, "rb+") as f:
+        pos = f.seek(0, os.SEEK_END)
+        # dosyanın sonundan geriye doğru son '\n' karakterini ara
+        while pos > 0:
+            f.seek(pos - 1)
+            if f.read(1) == b"\n":
+                break
+            pos -= 1
+        f.truncate(pos)
+
+
+class JsonlSink:
+    """Sonuçları JSONL dosyasına ekleyerek yazar."""
+
+    def __init__(self, output: str, append: bool):
+        if append:
+            _drop_partial_tail(output)
+        self._f = open(output, "a" if append else "w", encoding="utf-8")
+
+    def write(self, records: List[Dict[str, Any]]):
+        for r in records:
+            self._f.write(json.dumps(r, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+_STRING_COLUMNS = ("id", "algorithm", "start", "goal", "error")
+
+
+def _as_str(value) -> Optional[str]:
+    """Sorgudan gelen id/düğüm değerlerini (ör. int id) string kolona uydurur."""
+    return None if value is None else str(value)
+
+
+def _result_schema():
+    """RESULT_COLUMNS için sabit Parquet şeması."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("line", pa.int64()),
+            ("id", pa.string()),
+            ("algorithm", pa.string()),
+            ("start", pa.string()),
+            ("goal", pa.string()),
+            ("found", pa.bool_()),
+            ("path", pa.list_(pa.string())),
+            ("total_time", pa.float64()),
+            ("total_cost", pa.float64()),
+            ("total_distance", pa.float64()),
+            ("transfers", pa.int64()),
+            ("solutions", pa.string()),
+            ("error", pa.string()),
+        ]
+    )
+
+
+class ParquetSink:
+    """
+    Sonuçları bir klasöre parça parça (part-XXXXX.parquet) yazar.
+    Parquet dosyası sonradan eklenemediği için her tampon ayrı bir parçadır;
+    resume sırasında mevcut parçalar korunur ve numaralandırma devam eder.
+    """
+
+    def __init__(self, output: str, append: bool, buffer_size: int = 5000):
+        os.makedirs(output, exist_ok=True)
+        if not append:
+            for name in os.listdir(output):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(output, name))
+        self._dir = output
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_size = buffer_size
+        self._part = sum(1 for n in os.listdir(output) if n.endswith(".parquet"))
+
+    def write(self, records: List[Dict[str, Any]]):
+        self._buffer.extend(records)
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows = []
+        for r in self._buffer:
+            row = {c: r.get(c) for c in RESULT_COLUMNS}
+            for c in _STRING_COLUMNS:
+                row[c] = _as_str(row[c])
+            if row["path"] is not None:
+                row["path"] = [str(n) for n in row["path"]]
+            # iç içe çözüm listesi parquet şemasını sabit tutmak için JSON string
+            if row["solutions"] is not None:
+                row["solutions"] = json.dumps(row["solutions"], ensure_ascii=False)
+            rows.append(row)
+
+        # şema açık verilir: tümü None olan bir kolon parçadan parçaya `null` tipine düşmesin
+        table = pa.Table.from_pylist(rows, schema=_result_schema())
+        pq.write_table(table, os.path.join(self._dir, f"part-{self._part:05d}.parquet"))
+        self._part += 1
+        self._buffer = []
+
+    def close(self):
+        self._flush()
+
+
+# -----------------------------
+#  Ana batch döngüsü
+# -----------------------------
+def run_batch(
+    input_path: str,
+    output: str,
+    fmt: str = "jsonl",
+    workers: int | None = None,
+    chunk_size: int = 16,
+    ordered: bool = True,
+    resume: bool = False,
+    nodes_path: str | None = None,
+    edges_path: str | None = None,
+    progress_every: float = 5.0,
+) -> Dict[str, float]:
+    """
+    Sorgu dosyasını process pool üzerinde çalıştırır ve sonuçları akış halinde yazar.
+
+    Bellek sınırlı kalsın diye aynı anda en fazla `workers * 4` grup bekletilir;
+    girdi dosyası da satır satır okunur. `ordered=False` ise sonuçlar
+    tamamlanma sırasıyla yazılır (daha yüksek verim).
+    """
+    nodes_path = nodes_path or os.path.join(DATA_DIR, "nodes.csv")
+    edges_path = edges_path or os.path.join(DATA_DIR, "edges.csv")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 4
+
+    # resume: başarılı satırlar atlanır, hatalı satırların kayıtları silinip yeniden denenir
+    retried = drop_failed_rows(output, fmt) if resume else 0
+    skip = completed_lines(output, fmt) if resume else set()
+    append = resume and bool(skip)
+
+    if fmt == "jsonl":
+        sink = JsonlSink(output, append)
+    elif fmt == "parquet":
+        sink = ParquetSink(output, append)
+    else:
+        raise ValueError(f"Bilinmeyen çıktı formatı: {fmt}")
+
+    chunks = iter_chunks(iter_queries(input_path, skip), chunk_size)
+    n_done = 0
+    n_errors = 0
+    t0 = time.perf_counter()
+    last_report = t0
+
+    def _consume(records):
+        nonlocal n_done, n_errors, last_report
+        sink.write(records)
+        n_done += len(records)
+        n_errors += sum(1 for r in records if r.get("error"))
+
+        now = time.perf_counter()
+        if progress_every and now - last_report >= progress_every:
+            rate = n_done / (now - t0)
+            print(f"{n_done} sorgu tamamlandı ({rate:.1f} sorgu/sn)", file=sys.stderr)
+            last_report = now
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(nodes_path, edges_path),
+        ) as pool:
+            if ordered:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_run_chunk, chunk))
+                    if len(pending) >= max_in_flight:
+                        _consume(pending.popleft().result())
+                while pending:
+                    _consume(pending.popleft().result())
+            else:
+                pending = set()
+                for chunk in chunks:
+                    pending.add(pool.submit(_run_chunk, chunk))
+                    if len(pending) >= max_in_flight:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in finished:
+                            _consume(fut.result())
+                for fut in pending:
+                    _consume(fut.result())
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - t0
+    return {
+        "queries": n_done,
+        "errors": n_errors,
+        "skipped": len(skip),
+        "retried": retried,
+        "seconds": elapsed,
+        "queries_per_sec": n_done / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSONL rota sorgularını toplu çalıştırır.")
+    parser.add_argument("input", help="Sorgu dosyası (JSONL, her satır bir sorgu)")
+    parser.add_argument("-o", "--output", required=True, help="Çıktı dosyası (jsonl) veya klasörü (parquet)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    parser.add_argument("--unordered", action="store_true", help="Sonuçları tamamlanma sırasıyla yaz")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Başarıyla tamamlanmış satırları atla; hatalı satırları yeniden dene",
+    )
+    parser.add_argument("--nodes", default=None)
+    parser.add_argument("--edges", default=None)
+    args = parser.parse_args(argv)
+
+    summary = run_batch(
+        args.input,
+        args.output,
+        fmt=args.format,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        ordered=not args.unordered,
+        resume=args.resume,
+        nodes_path=args.nodes,
+        edges_path=args.edges,
+    )
+
+    print(
+        f"Toplam: {summary['queries']} sorgu, {summary['errors']} hata, "
+        f"{summary['skipped']} satır atlandı, {summary['retried']} hatalı satır yeniden denendi, "
+        f"{summary['seconds']:.2f} sn, {summary['queries_per_sec']:.1f} sorgu/sn"
+    )
+
+
+if __name__ == "__main__":
+    main()
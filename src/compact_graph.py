@@ -0,0 +1,342 @@
+"""
+Kompakt (dizi tabanlı) graf gösterimi.
+
+NetworkX her düğüm/kenar için ayrı bir attribute sözlüğü tutar; milyon
+kenarlı graflarda bellek ve erişim maliyeti bu sözlüklerden gelir. Burada:
+  - düğüm id'leri intern edilmiş string listesi + yoğun int indeks
+  - has_metro/has_bus/has_train/has_bike tek bir uint8 bit maskesi (Service)
+  - modlar küçük bir enum (Mode, uint8)
+  - koordinatlar ve kenar metrikleri float32 diziler
+  - kenarlar kuyruk düğümüne göre CSR (indptr / head) düzeninde
+
+Çözücüler içeride int indekslerle çalışır; sonuç rotaları API sınırında
+orijinal id'lere (ör. "N6") geri çevrilir.
+"""
+import heapq
+import math
+import sys
+from enum import IntEnum, IntFlag
+from typing import Any, Dict, List, Sequence
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+
+class Mode(IntEnum):
+    """Ulaşım modu kodları (visualization.MODE_COLORS ile aynı sıra)."""
+
+    METRO = 0
+    BUS = 1
+    TRAIN = 2
+    WALK = 3
+    BIKE = 4
+    CAR = 5
+
+
+class Service(IntFlag):
+    """Düğümde bulunan hizmetlerin bit maskesi."""
+
+    METRO = 1
+    BUS = 2
+    TRAIN = 4
+    BIKE = 8
+
+
+MODE_NAMES = [m.name.lower() for m in Mode]
+MODE_CODES = {name: code for code, name in enumerate(MODE_NAMES)}
+
+# nodes.csv kolonu -> Service biti
+_FLAG_COLUMNS = {
+    "has_metro": Service.METRO,
+    "has_bus": Service.BUS,
+    "has_train": Service.TRAIN,
+    "has_bike": Service.BIKE,
+}
+
+
+# -----------------------------
+#  Kurulum
+# -----------------------------
+def _from_arrays(
+    ids: Sequence[str],
+    names: Sequence[str],
+    x,
+    y,
+    flags,
+    tail,
+    head,
+    mode,
+    travel_time,
+    cost,
+    distance,
+    is_transfer,
+) -> Dict[str, Any]:
+    """Düğüm ve (indekslenmiş) kenar dizilerinden CSR düzeninde kompakt graf kurar."""
+    ids = [sys.intern(str(n)) for n in ids]
+    n_nodes = len(ids)
+
+    tail = np.asarray(tail, dtype=np.int32)
+    head = np.asarray(head, dtype=np.int32)
+    order = np.lexsort((head, tail))  # kuyruk, sonra baş düğüme göre sırala
+
+    indptr = np.zeros(n_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(tail, minlength=n_nodes), out=indptr[1:])
+
+    return {
+        "ids": ids,
+        "index": {n: i for i, n in enumerate(ids)},
+        "names": list(names),
+        "x": np.asarray(x, dtype=np.float32),
+        "y": np.asarray(y, dtype=np.float32),
+        "flags": np.asarray(flags, dtype=np.uint8),
+        "indptr": indptr,
+        "head": head[order],
+        "mode": np.asarray(mode, dtype=np.uint8)[order],
+        "travel_time": np.asarray(travel_time, dtype=np.float32)[order],
+        "cost": np.asarray(cost, dtype=np.float32)[order],
+        "distance": np.asarray(distance, dtype=np.float32)[order],
+        "is_transfer": np.asarray(is_transfer, dtype=bool)[order],
+    }
+
+
+def build_compact_graph(nodes_path: str, edges_path: str) -> Dict[str, Any]:
+    """
+    nodes.csv ve edges.csv'den doğrudan kompakt graf kurar (NetworkX yok).
+
+    Kenar anlamı build_graph ile aynıdır: aynı (from, to) için son satır
+    geçerlidir; ters yön, ileri yönde hiç tanımlanmamışsa ilk uygun satırdan
+    simetrik olarak eklenir.
+    """
+    nodes = pd.read_csv(nodes_path)
+    edges = pd.read_csv(edges_path)
+
+    ids = nodes["node_id"].astype(str).tolist()
+    flags = np.zeros(len(nodes), dtype=np.uint8)
+    for col, bit in _FLAG_COLUMNS.items():
+        flags |= (nodes[col].to_numpy(dtype=np.int64) != 0).astype(np.uint8) * np.uint8(bit)
+
+    cols = ["mode", "travel_time_min", "cost_tl", "distance_m", "is_transfer"]
+    fwd = edges[["from", "to"] + cols].drop_duplicates(["from", "to"], keep="last")
+    rev = edges[["to", "from"] + cols].rename(columns={"to": "from", "from": "to"})
+    rev = rev.drop_duplicates(["from", "to"], keep="first")
+    fwd_keys = pd.MultiIndex.from_frame(fwd[["from", "to"]])
+    rev = rev[~pd.MultiIndex.from_frame(rev[["from", "to"]]).isin(fwd_keys)]
+    all_edges = pd.concat([fwd, rev], ignore_index=True)
+
+    index = pd.Series(np.arange(len(ids)), index=ids)
+    unknown = sorted(set(all_edges["mode"]) - set(MODE_CODES))
+    if unknown:
+        raise ValueError(f"Bilinmeyen mod(lar): {unknown}")
+
+    return _from_arrays(
+        ids,
+        nodes["name"].astype(str).tolist(),
+        nodes["x"].to_numpy(),
+        nodes["y"].to_numpy(),
+        flags,
+        index[all_edges["from"].astype(str)].to_numpy(),
+        index[all_edges["to"].astype(str)].to_numpy(),
+        all_edges["mode"].map(MODE_CODES).to_numpy(),
+        all_edges["travel_time_min"].to_numpy(),
+        all_edges["cost_tl"].to_numpy(),
+        all_edges["distance_m"].to_numpy(),
+        all_edges["is_transfer"].to_numpy(),
+    )
+
+
+def compact_from_networkx(G: nx.DiGraph) -> Dict[str, Any]:
+    """build_graph çıktısını (veya aynı attribute'lara sahip bir grafı) kompakt hale getirir."""
+    ids = list(G.nodes())
+    index = {n: i for i, n in enumerate(ids)}
+    data = [G.nodes[n] for n in ids]
+
+    flags = np.zeros(len(ids), dtype=np.uint8)
+    for col, bit in _FLAG_COLUMNS.items():
+        flags |= np.asarray([int(d[col] != 0) for d in data], dtype=np.uint8) * np.uint8(bit)
+
+    n_edges = G.number_of_edges()
+    tail = np.empty(n_edges, dtype=np.int32)
+    head = np.empty(n_edges, dtype=np.int32)
+    mode = np.empty(n_edges, dtype=np.uint8)
+    metrics = np.empty((n_edges, 4), dtype=np.float32)
+    for e, (u, v, d) in enumerate(G.edges(data=True)):
+        tail[e] = index[u]
+        head[e] = index[v]
+        mode[e] = MODE_CODES[d["mode"]]
+        metrics[e] = (d["travel_time"], d["cost"], d["distance"], d["is_transfer"])
+
+    return _from_arrays(
+        ids,
+        [d["name"] for d in data],
+        [d["x"] for d in data],
+        [d["y"] for d in data],
+        flags,
+        tail,
+        head,
+        mode,
+        metrics[:, 0],
+        metrics[:, 1],
+        metrics[:, 2],
+        metrics[:, 3],
+    )
+
+
+# -----------------------------
+#  Erişim yardımcıları
+# -----------------------------
+def to_ids(cg: Dict[str, Any], path_idx: Sequence[int]) -> List[str]:
+    """İndeks rotasını orijinal düğüm id'lerine çevirir."""
+    ids = cg["ids"]
+    return [ids[i] for i in path_idx]
+
+
+def has_service(cg: Dict[str, Any], node: str, service: Service) -> bool:
+    """Düğümde verilen hizmet (ör. Service.METRO) var mı?"""
+    return bool(cg["flags"][cg["index"][node]] & service)
+
+
+def edge_id(cg: Dict[str, Any], u: int, v: int) -> int:
+    """u -> v kenarının CSR indeksi; yoksa -1. (Satır içi baş düğümler sıralı.)"""
+    lo, hi = cg["indptr"][u], cg["indptr"][u + 1]
+    k = lo + int(np.searchsorted(cg["head"][lo:hi], v))
+    if k < hi and cg["head"][k] == v:
+        return int(k)
+    return -1
+
+
+def memory_bytes(cg: Dict[str, Any]) -> Dict[str, int]:
+    """Dizi bellek kullanımı (düğüm / kenar tarafı ayrı, bayt)."""
+    node_arrays = ("x", "y", "flags", "indptr")
+    edge_arrays = ("head", "mode", "travel_time", "cost", "distance", "is_transfer")
+    return {
+        "nodes": sum(cg[k].nbytes for k in node_arrays),
+        "edges": sum(cg[k].nbytes for k in edge_arrays),
+    }
+
+
+def path_stats_compact(cg: Dict[str, Any], path: List[str]) -> Dict[str, Any]:
+    """utils.path_stats ile aynı sözlüğü kompakt graf üzerinden üretir."""
+    total_time = 0.0
+    total_cost = 0.0
+    total_distance = 0.0
+    transfers = 0
+    modes = []
+    last_mode = None
+
+    index = cg["index"]
+    for u, v in zip(path[:-1], path[1:]):
+        e = edge_id(cg, index[u], index[v])
+        if e < 0:
+            raise ValueError(f"Grafikte {u} -> {v} kenarı yok.")
+
+        total_time += float(cg["travel_time"][e])
+        total_cost += float(cg["cost"][e])
+        total_distance += float(cg["distance"][e])
+
+        mode = MODE_NAMES[cg["mode"][e]]
+        modes.append(mode)
+        if last_mode is not None and mode != last_mode:
+            transfers += 1
+        last_mode = mode
+
+    return {
+        "total_time": total_time,
+        "total_cost": total_cost,
+        "total_distance": total_distance,
+        "transfers": transfers,
+        "modes": modes,
+    }
+
+
+# -----------------------------
+#  Çözücü
+# -----------------------------
+def solve_astar_compact(
+    cg: Dict[str, Any],
+    start: str,
+    goal: str,
+    allowed_modes=None,
+    max_cost: float | None = None,
+    max_time: float | None = None,
+):
+    """
+    astar_solver.solve_astar_constrained'in kompakt graf sürümü.
+    Girdi ve çıktı orijinal id'lerle; arama int indekslerle yapılır.
+    (path, toplam süre, toplam maliyet) ya da (None, None, None) döner.
+    """
+    if allowed_modes is None:
+        allowed = np.ones(len(Mode), dtype=bool)
+    else:
+        allowed = np.zeros(len(Mode), dtype=bool)
+        for m in allowed_modes:
+            allowed[MODE_CODES[m]] = True
+
+    index = cg["index"]
+    s, t = index[start], index[goal]
+    x, y = cg["x"], cg["y"]
+    gx, gy = float(x[t]), float(y[t])
+    indptr, head = cg["indptr"], cg["head"]
+    edge_ok = allowed[cg["mode"]]
+    tt, cc = cg["travel_time"], cg["cost"]
+
+    def h(i):
+        # astar_solver.heuristic ile aynı ölçek
+        return math.hypot(float(x[i]) - gx, float(y[i]) - gy) / 0.03
+
+    open_list = [(h(s), 0.0, s, 0.0)]
+    visited = {s: (0.0, 0.0)}
+    parent = {(s, 0.0, 0.0): None}
+
+    while open_list:
+        _, time_so_far, node, cost_so_far = heapq.heappop(open_list)
+
+        if node == t:
+            path = [node]
+            key = (node, time_so_far, cost_so_far)
+            while parent[key] is not None:
+                key = parent[key]
+                path.append(key[0])
+            path.reverse()
+            return to_ids(cg, path), time_so_far, cost_so_far
+
+        for e in range(indptr[node], indptr[node + 1]):
+            if not edge_ok[e]:
+                continue
+            nb = int(head[e])
+            new_time = time_so_far + float(tt[e])
+            new_cost = cost_so_far + float(cc[e])
+
+            if (max_time is not None) and (new_time > max_time):
+                continue
+            if (max_cost is not None) and (new_cost > max_cost):
+                continue
+
+            if nb in visited:
+                best_time, best_cost = visited[nb]
+                if (new_time >= best_time) and (new_cost >= best_cost):
+                    continue
+
+            visited[nb] = (new_time, new_cost)
+            parent[(nb, new_time, new_cost)] = (node, time_so_far, cost_so_far)
+            heapq.heappush(open_list, (new_time + h(nb), new_time, nb, new_cost))
+
+    return None, None, None
+
+
+if __name__ == "__main__":
+    from utils import DATA_DIR
+    import os
+
+    cg = build_compact_graph(
+        os.path.join(DATA_DIR, "nodes.csv"), os.path.join(DATA_DIR, "edges.csv")
+    )
+    mem = memory_bytes(cg)
+    print(f"Düğüm: {len(cg['ids'])}, kenar: {cg['head'].size}")
+    print(f"Dizi belleği: düğüm {mem['nodes']} B, kenar {mem['edges']} B")
+
+    p, t, c = solve_astar_compact(cg, "N6", "N8", allowed_modes={"bus", "metro", "train", "walk"})
+    print("Rota:", " -> ".join(p) if p else "Rota yok")
+    if p:
+        print(f"Süre: {t} dk, Maliyet: {c} TL")
+        print(path_stats_compact(cg, p))
@@ -1,9 +1,26 @@
+import math
+from array import array
+from bisect import bisect_right
+
+import numpy as np
 import pandas as pd
 import networkx as nx
 
 
-def build_graph(nodes_path: str, edges_path: str) -> nx.DiGraph:
-    """nodes.csv ve edges.csv dosyalarından yönlü bir grafik (DiGraph) oluşturur."""
+# Zaman profilleri bir günlük periyotla tekrar eder (dakika)
+DAY_MINUTES = 1440.0
+
+
+def build_graph(
+    nodes_path: str,
+    edges_path: str,
+    profiles_path: str | None = None,
+) -> nx.DiGraph:
+    """
+    nodes.csv ve edges.csv dosyalarından yönlü bir grafik (DiGraph) oluşturur.
+    profiles_path verilirse kenarlara günün saatine bağlı süre profilleri eklenir
+    (bkz. load_time_profiles).
+    """
     nodes = pd.read_csv(nodes_path)
     edges = pd.read_csv(edges_path)
 
@@ -42,9 +59,153 @@ def build_graph(nodes_path: str, edges_path: str) -> nx.DiGraph:
         if not G.has_edge(v, u):
             G.add_edge(v, u, **attrs)
 
+    if profiles_path is not None:
+        load_time_profiles(G, profiles_path)
+
     return G
 
 
+def load_time_profiles(G: nx.DiGraph, profiles_path: str, period: float = DAY_MINUTES):
+    """
+    edge_profiles.csv (from, to, time_min, travel_time_min) dosyasını okuyup
+    grafa ekler. Bkz. attach_time_profiles.
+    """
+    attach_time_profiles(G, pd.read_csv(profiles_path), period=period)
+
+
+def attach_time_profiles(G: nx.DiGraph, profiles: pd.DataFrame, period: float = DAY_MINUTES):
+    """
+    Günün saatine bağlı parçalı doğrusal süre profillerini grafa ekler.
+
+    Profiller kenar başına Python nesnesi olarak değil, tüm kenarların
+    paylaştığı düz diziler halinde G.graph["td_profiles"] içinde tutulur:
+      - times / values: float32 kırılma noktaları (kalkış dakikası, süre)
+      - offsets:        i. profilin kırılma noktaları [offsets[i], offsets[i+1])
+      - min_speed:      dakika / koordinat birimi alt sınırı (bkz. td_min_speed)
+    Diziler `array.array` olarak saklanır: bellek float32 kadar, tek eleman
+    erişimi ise Python float'ı kadar ucuzdur (td_travel_time sıcak döngüsü).
+    Kenarda yalnızca "profile" (int) attribute'u bulunur; profili olmayan
+    kenarlar statik travel_time ile kalır. Profiller yönlüdür, yani ters
+    yön için ayrı satırlar verilebilir.
+
+    Her profil FIFO (erken çıkan erken varır) olmalıdır: ardışık kırılma
+    noktaları arasındaki eğim -1'den küçük olamaz. Aksi halde ValueError;
+    doğrulama grafa dokunmadan önce yapılır, hata durumunda graf değişmez.
+    """
+    # (from, to) çiftini tek bir grup koduna çevir, sonra kod + zamana göre sırala
+    pair_codes, pair_index = pd.MultiIndex.from_frame(profiles[["from", "to"]]).factorize()
+    pairs = pair_index.tolist()
+    t = profiles["time_min"].to_numpy(dtype=float) % period
+    d = profiles["travel_time_min"].to_numpy(dtype=float)
+    order = np.lexsort((t, pair_codes))
+    code, t, d = pair_codes[order], t[order], d[order]
+
+    missing = [(u, v) for u, v in pairs if not G.has_edge(u, v)]
+    if missing:
+        u, v = missing[0]
+        raise ValueError(f"Profil verilen {u} -> {v} kenarı grafikte yok.")
+
+    n = len(t)
+    starts = np.flatnonzero(np.diff(code, prepend=-1))
+    ends = np.append(starts[1:], n)[: len(starts)]
+
+    # her noktanın bir sonrakine olan parçası; grubun son noktası periyodik
+    # olarak grubun ilk noktasına (bir periyot sonra) bağlanır
+    nxt = np.arange(1, n + 1)
+    nxt[ends - 1] = starts
+    dt = t[nxt] - t
+    dt[ends - 1] += period
+    dd = d[nxt] - d
+    bad = (dt <= 0) | (dd < -dt)
+    if bad.any():
+        u, v = pairs[code[np.argmax(bad)]]
+        raise ValueError(f"{u} -> {v} profili FIFO değil ya da tekrar eden zaman içeriyor.")
+
+    # doğrulama bitti: artık grafı değiştir
+    for _, _, data in G.edges(data=True):
+        data.pop("profile", None)
+    for pid, start in enumerate(starts):
+        u, v = pairs[code[start]]
+        G[u][v]["profile"] = pid
+
+    G.graph["td_profiles"] = {
+        "period": float(period),
+        "times": array("f", t),
+        "values": array("f", d),
+        "offsets": array("i", np.r_[starts, n].tolist()),
+    }
+    G.graph["td_profiles"]["min_speed"] = td_min_speed(G)
+    G.graph.pop("td_min_speed", None)  # profilsiz graf için saklanmış eski sınır
+
+
+def td_min_speed(G: nx.DiGraph) -> float:
+    """
+    Kenar süresinin (her kalkış anında) öklid uzunluğa oranının alt sınırı
+    (dakika / koordinat birimi). Parçalı doğrusal profilin minimumu kırılma
+    noktalarındadır. dist(n, goal) * min_speed her rota için gerçek süreyi
+    aşmaz ve tutarlıdır (üçgen eşitsizliği), yani zamana bağlı A* için
+    geçerli bir heuristic verir.
+
+    Tam kenar taraması yapar; solve_astar_time_dependent sonucu
+    G.graph["td_profiles"]["min_speed"] ya da (profilsiz graflarda)
+    G.graph["td_min_speed"] içinde saklar. Koordinat veya süre değişirse
+    bu değer yeniden hesaplanmalıdır.
+    """
+    prof = G.graph.get("td_profiles")
+    best = math.inf
+    for u, v, data in G.edges(data=True):
+        nu, nv = G.nodes[u], G.nodes[v]
+        length = math.hypot(nu["x"] - nv["x"], nu["y"] - nv["y"])
+        if length == 0:
+            continue
+        pid = data.get("profile")
+        if pid is None or prof is None:
+            minutes = data["travel_time"]
+        else:
+            minutes = min(prof["values"][prof["offsets"][pid] : prof["offsets"][pid + 1]])
+        best = min(best, minutes / length)
+    return 0.0 if best == math.inf else max(best, 0.0)
+
+
+def td_travel_time(G: nx.DiGraph, u: str, v: str, depart: float) -> float:
+    """u -> v kenarının `depart` dakikasında kalkışla süresi (profil yoksa statik süre)."""
+    return td_edge_time(G.graph.get("td_profiles"), G[u][v], depart)
+
+
+def td_edge_time(prof, data, depart: float) -> float:
+    """
+    td_travel_time'ın kenar sözlüğü üzerinden çalışan sürümü; arama
+    döngüleri G[u][v] aramasını tekrarlamadan doğrudan bunu çağırır.
+    prof: G.graph["td_profiles"] (profil yoksa None)
+    """
+    pid = data.get("profile")
+    if pid is None:
+        return data["travel_time"]
+
+    period = prof["period"]
+    offsets, times, values = prof["offsets"], prof["times"], prof["values"]
+    lo, hi = offsets[pid], offsets[pid + 1]
+
+    if hi - lo == 1:
+        return values[lo]
+
+    t = depart % period
+    i = bisect_right(times, t, lo, hi) - 1
+    if i < lo:
+        # ilk kırılma noktasından önce: önceki günün son parçası
+        t0, d0 = times[hi - 1] - period, values[hi - 1]
+        t1, d1 = times[lo], values[lo]
+    elif i == hi - 1:
+        # son kırılma noktasından sonra: ertesi günün ilk noktasına doğru
+        t0, d0 = times[i], values[i]
+        t1, d1 = times[lo] + period, values[lo]
+    else:
+        t0, d0 = times[i], values[i]
+        t1, d1 = times[i + 1], values[i + 1]
+
+    return d0 + (d1 - d0) * (t - t0) / (t1 - t0)
+
+
 if __name__ == "__main__":
     G = build_graph("data/nodes.csv", "data/edges.csv")
 
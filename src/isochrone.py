@@ -0,0 +1,239 @@
+"""
+Tek kaynaktan tüm düğümlere erişilebilirlik (isochrone) hesapları.
+
+"Buradan 30 dakikada toplu taşımayla nereye gidilir?" sorusu için her hedef
+başına A* çalıştırmak yerine, tek bir kova kuyruklu (Dial) Dijkstra ile
+süre bütçesi içindeki tüm düğümlerin varış zamanları hesaplanır.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+from utils import load_default_graph
+
+
+ALL_MODES = {"metro", "bus", "train", "walk", "bike", "car"}
+
+# Her worker sürecinde bir kez derlenen graf
+_WORKER_COMPILED: Dict[str, Any] | None = None
+
+
+def compile_graph(
+    G: nx.DiGraph,
+    allowed_modes=None,
+    resolution: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Grafı izin verilen modlara göre filtreleyip tamsayı ağırlıklı komşuluk
+    listesine çevirir. Süreler `resolution` dakikalık birimlere yukarı
+    yuvarlanır (varsayılan 1 dk; veri zaten tam dakika olduğundan kayıpsız).
+
+    Aynı mod kümesi için birden çok kaynaktan sorgu yapılacaksa bu sonuç
+    tekrar kullanılabilir.
+    """
+    allowed_modes = ALL_MODES if allowed_modes is None else set(allowed_modes)
+
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    adj: List[List[Tuple[int, int]]] = [[] for _ in nodes]
+
+    for u, v, data in G.edges(data=True):
+        if data["mode"] not in allowed_modes:
+            continue
+        w = int(math.ceil(data["travel_time"] / resolution - 1e-9))
+        adj[index[u]].append((index[v], max(w, 0)))
+
+    return {
+        "nodes": nodes,
+        "index": index,
+        "adj": adj,
+        "x": np.asarray([G.nodes[n]["x"] for n in nodes], dtype=float),
+        "y": np.asarray([G.nodes[n]["y"] for n in nodes], dtype=float),
+        "resolution": resolution,
+    }
+
+
+def _dial(adj: List[List[Tuple[int, int]]], source: int, budget: int) -> List[int]:
+    """
+    Kova kuyruklu Dijkstra: dist[v] <= budget olan tüm düğümlerin tamsayı
+    mesafesi. Ulaşılamayanlar -1 döner. Kova sayısı bütçe kadar olduğundan
+    her düğüm en fazla bir kez kesin (settled) hale gelir.
+    """
+    n = len(adj)
+    dist = [-1] * n
+    buckets: List[List[int]] = [[] for _ in range(budget + 1)]
+
+    dist[source] = 0
+    buckets[0].append(source)
+
+    for b in range(budget + 1):
+        bucket = buckets[b]
+        # aynı kovaya sıfır ağırlıklı kenarlarla eklenenler de işlensin
+        i = 0
+        while i < len(bucket):
+            u = bucket[i]
+            i += 1
+            if dist[u] != b:
+                continue  # daha kısa bir mesafeyle zaten işlendi
+            for v, w in adj[u]:
+                nd = b + w
+                if nd > budget:
+                    continue
+                if dist[v] == -1 or nd < dist[v]:
+                    dist[v] = nd
+                    buckets[nd].append(v)
+        buckets[b] = []
+
+    return dist
+
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """Monotone chain ile dışbükey zarf; kapalı poligon (ilk nokta sonda tekrar) döndürür."""
+    pts = sorted(set(map(tuple, np.asarray(points, dtype=float).tolist())))
+    if len(pts) <= 2:
+        return np.asarray(pts + pts[:1], dtype=float)
+
+    def _cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower: List[Tuple[float, float]] = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+
+    upper: List[Tuple[float, float]] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+
+    hull = lower[:-1] + upper[:-1]
+    return np.asarray(hull + hull[:1], dtype=float)
+
+
+def _result_from_dist(
+    compiled: Dict[str, Any],
+    start: str,
+    dist: List[int],
+    max_time: float,
+    with_polygon: bool,
+) -> Dict[str, Any]:
+    """Tamsayı mesafelerden kullanıcıya dönen sonuç sözlüğünü oluşturur."""
+    d = np.asarray(dist, dtype=float)
+    reached = d >= 0
+    arrival = np.where(reached, d * compiled["resolution"], np.inf)
+
+    nodes = compiled["nodes"]
+    result = {
+        "start": start,
+        "max_time": max_time,
+        "nodes": nodes,
+        "arrival": arrival,
+        "reachable": {nodes[i] for i in np.flatnonzero(reached)},
+    }
+
+    if with_polygon:
+        pts = np.column_stack([compiled["x"][reached], compiled["y"][reached]])
+        result["polygon"] = convex_hull(pts)
+
+    return result
+
+
+def reachable_within(
+    G: nx.DiGraph,
+    start: str,
+    max_time: float,
+    allowed_modes=None,
+    resolution: float = 1.0,
+    with_polygon: bool = False,
+    compiled: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    `start` düğümünden `max_time` dakika içinde ulaşılabilen düğümler.
+
+    Döndürülen sözlük:
+      - nodes:     düğüm listesi (arrival dizisiyle aynı sırada)
+      - arrival:   varış süreleri (dk), ulaşılamayanlar inf
+      - reachable: bütçe içindeki düğümlerin kümesi
+      - polygon:   (with_polygon=True ise) erişilen düğümlerin dışbükey zarfı
+    """
+    if compiled is None:
+        compiled = compile_graph(G, allowed_modes, resolution)
+
+    budget = int(math.floor(max_time / compiled["resolution"] + 1e-9))
+    dist = _dial(compiled["adj"], compiled["index"][start], budget)
+    return _result_from_dist(compiled, start, dist, max_time, with_polygon)
+
+
+def _init_worker(G: nx.DiGraph, allowed_modes, resolution: float):
+    """Process pool initializer: grafı her worker'da bir kez derler."""
+    global _WORKER_COMPILED
+    _WORKER_COMPILED = compile_graph(G, allowed_modes, resolution)
+
+
+def _worker_reachable(args) -> Dict[str, Any]:
+    start, max_time, with_polygon = args
+    assert _WORKER_COMPILED is not None, "Worker grafı derlenmedi."
+    return reachable_within(
+        None, start, max_time, with_polygon=with_polygon, compiled=_WORKER_COMPILED
+    )
+
+
+def reachable_many(
+    G: nx.DiGraph,
+    starts: Iterable[str],
+    max_time: float,
+    allowed_modes=None,
+    resolution: float = 1.0,
+    with_polygon: bool = False,
+    n_workers: int | None = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Birden çok başlangıç noktası için `reachable_within` sonuçları
+    ({start: sonuç}). n_workers > 1 ise kaynaklar process pool'a dağıtılır;
+    graf her worker'da yalnızca bir kez derlenir.
+    """
+    starts = list(starts)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if n_workers <= 1 or len(starts) <= 1:
+        compiled = compile_graph(G, allowed_modes, resolution)
+        return {
+            s: reachable_within(G, s, max_time, with_polygon=with_polygon, compiled=compiled)
+            for s in starts
+        }
+
+    tasks = [(s, max_time, with_polygon) for s in starts]
+    chunksize = max(1, len(tasks) // (n_workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(G, allowed_modes, resolution),
+    ) as pool:
+        results = pool.map(_worker_reachable, tasks, chunksize=chunksize)
+        return {r["start"]: r for r in results}
+
+
+if __name__ == "__main__":
+    G = load_default_graph()
+
+    res = reachable_within(
+        G,
+        "N6",
+        30.0,
+        allowed_modes={"bus", "metro", "train", "walk"},
+        with_polygon=True,
+    )
+    print("30 dk içinde toplu taşımayla erişilen düğümler (N6'dan):")
+    for n, t in sorted(zip(res["nodes"], res["arrival"]), key=lambda x: x[1]):
+        if math.isfinite(t):
+            print(f"  {n}: {t:.0f} dk")
+
+    many = reachable_many(G, ["N1", "N6", "N8"], 20.0, n_workers=2)
+    for s, r in many.items():
+        print(f"{s}: 20 dk içinde {len(r['reachable'])} düğüm")
@@ -0,0 +1,186 @@
+"""
+Çok sayıda başlangıç-hedef (OD) çifti için toplu NSGA-II.
+
+Her çift için ayrı ayrı run_nsga2 çağırmak; kenar değerlendirmesini,
+aday düğüm listesini ve başlangıç popülasyonunu her seferinde sıfırdan
+kurar. Burada:
+  - Kenar tablosu (segment maliyetleri) ve rota uygunluk önbelleği her
+    worker'da bir kez kurulur ve tüm çiftler tarafından paylaşılır.
+  - Çiftler başlangıç düğümüne göre gruplanır; her başlangıç için süre ve
+    maliyet ağırlıklı birer en kısa yol ağacı bir kez hesaplanır ve o
+    başlangıçtan çıkan tüm çiftlerin ilk popülasyonu bu ağaçlardan gelen
+    rotalarla tohumlanır.
+  - Başlangıç grupları process pool üzerinde paralel çalışır.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+from nsga_solver import build_edge_table, run_nsga2
+from utils import load_default_graph
+
+
+# Worker başına önbellek sınırı (aşılırsa temizlenir)
+MAX_CACHE_ENTRIES = 1_000_000
+
+# Her worker sürecinde bir kez kurulan paylaşımlı durum
+_WORKER_STATE: Dict[str, Any] | None = None
+
+
+def _init_worker(G: nx.DiGraph):
+    """Process pool initializer: grafı ve kenar tablosunu worker başına bir kez kurar."""
+    global _WORKER_STATE
+    _WORKER_STATE = {"G": G, "edge_table": build_edge_table(G), "fitness_cache": {}}
+
+
+def _tree_middles(
+    G: nx.DiGraph,
+    origin: str,
+    goals: Sequence[str],
+    weight: str,
+    max_len: int,
+) -> Dict[str, List[str]]:
+    """
+    origin'den tek bir Dijkstra ağacıyla her hedefe en kısa rotanın ara
+    düğümlerini çıkarır. Ara düğüm sayısı max_len'i aşan rotalar atlanır
+    (birey gösterimine sığmazlar).
+    """
+    pred, _ = nx.dijkstra_predecessor_and_distance(G, origin, weight=weight)
+
+    middles = {}
+    for goal in goals:
+        if goal not in pred or goal == origin:
+            continue
+        path = [goal]
+        while path[-1] != origin and len(path) <= max_len + 1:
+            path.append(pred[path[-1]][0])
+        if path[-1] != origin:
+            continue
+        middles[goal] = list(reversed(path[1:-1]))
+    return middles
+
+
+def _solve_origin(
+    state: Dict[str, Any],
+    origin: str,
+    goals: Sequence[str],
+    params: Dict[str, Any],
+) -> List[Tuple[str, str, List[dict]]]:
+    """Bir başlangıç düğümünden çıkan tüm çiftleri paylaşımlı ön hesaplarla çözer."""
+    G = state["G"]
+    max_len = params["max_intermediate_len"]
+
+    seeds: Dict[str, List[List[str]]] = {g: [] for g in goals}
+    if params["seed_paths"]:
+        for weight in ("travel_time", "cost"):
+            for goal, middle in _tree_middles(G, origin, goals, weight, max_len).items():
+                if middle not in seeds[goal]:
+                    seeds[goal].append(middle)
+
+    results = []
+    for goal in goals:
+        if len(state["fitness_cache"]) > MAX_CACHE_ENTRIES:
+            state["fitness_cache"].clear()
+
+        # çift başına sabit tohum: sonuç worker dağılımından bağımsız olsun.
+        # nsga_solver global random'ı kullanır; seri yolda çağıranın RNG durumu
+        # bozulmasın diye durum saklanıp çiftten sonra geri yüklenir.
+        rng_state = random.getstate()
+        random.seed(f"{params['seed']}:{origin}:{goal}")
+        try:
+            front = run_nsga2(
+                G,
+                origin,
+                goal,
+                n_generations=params["n_generations"],
+                pop_size=params["pop_size"],
+                max_intermediate_len=max_len,
+                selection=params["selection"],
+                verbose=False,
+                initial_middles=seeds[goal],
+                edge_table=state["edge_table"],
+                fitness_cache=state["fitness_cache"],
+            )
+        finally:
+            random.setstate(rng_state)
+        results.append((origin, goal, front))
+    return results
+
+
+def _worker_solve(task) -> List[Tuple[str, str, List[dict]]]:
+    origin, goals, params = task
+    assert _WORKER_STATE is not None, "Worker durumu kurulmadı."
+    return _solve_origin(_WORKER_STATE, origin, goals, params)
+
+
+def run_nsga2_batch(
+    G: nx.DiGraph,
+    od_pairs: Sequence[Tuple[str, str]],
+    n_generations: int = 40,
+    pop_size: int = 40,
+    max_intermediate_len: int = 4,
+    selection: str = "nsga2",
+    seed_paths: bool = True,
+    seed: int = 0,
+    n_workers: Optional[int] = None,
+) -> Dict[Tuple[str, str], List[dict]]:
+    """
+    OD çiftleri listesi için Pareto çözümlerini hesaplar.
+
+    Dönüş: {(start, goal): run_nsga2 biçiminde geçerli çözümler}.
+    seed_paths=True ise her çiftin ilk popülasyonuna en kısa süre ve en
+    düşük maliyet rotaları (ara düğüm sınırına sığıyorsa) eklenir.
+    Aynı `seed` ile sonuçlar worker sayısından bağımsızdır.
+    """
+    groups: Dict[str, List[str]] = {}
+    for s, g in od_pairs:
+        goals = groups.setdefault(s, [])
+        if g not in goals:
+            goals.append(g)
+
+    params = {
+        "n_generations": n_generations,
+        "pop_size": pop_size,
+        "max_intermediate_len": max_intermediate_len,
+        "selection": selection,
+        "seed_paths": seed_paths,
+        "seed": seed,
+    }
+    tasks = [(origin, goals, params) for origin, goals in groups.items()]
+    n_workers = n_workers or os.cpu_count() or 1
+
+    fronts: Dict[Tuple[str, str], List[dict]] = {}
+    if n_workers <= 1 or len(tasks) <= 1:
+        state = {"G": G, "edge_table": build_edge_table(G), "fitness_cache": {}}
+        for origin, goals, p in tasks:
+            for s, g, front in _solve_origin(state, origin, goals, p):
+                fronts[(s, g)] = front
+        return fronts
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(G,),
+    ) as pool:
+        for results in pool.map(_worker_solve, tasks):
+            for s, g, front in results:
+                fronts[(s, g)] = front
+    return fronts
+
+
+if __name__ == "__main__":
+    G = load_default_graph()
+    nodes = list(G.nodes())
+    pairs = [(s, g) for s in nodes for g in nodes if s != g]
+
+    t0 = time.perf_counter()
+    fronts = run_nsga2_batch(G, pairs, n_generations=20, pop_size=40)
+    elapsed = time.perf_counter() - t0
+
+    solved = sum(1 for f in fronts.values() if f)
+    print(f"{len(pairs)} OD çifti, {solved} tanesinde geçerli çözüm bulundu.")
+    print(f"Süre: {elapsed:.2f} sn, {len(pairs) / elapsed:.1f} cephe/sn")
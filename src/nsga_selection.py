@@ -0,0 +1,295 @@
+"""
+NumPy tabanlı NSGA-II / NSGA-III seçim operatörleri.
+
+DEAP'in `tools.selNSGA2` fonksiyonu saf Python ile O(M·N²) karşılaştırma yapar;
+binlerce bireylik popülasyonlarda nesil başına saniyeler sürer. Buradaki
+fonksiyonlar aynı imzayı (`select(individuals, k)`) kullanır, bu yüzden
+toolbox'a doğrudan kaydedilebilir.
+"""
+import random
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+# Baskınlık matrisini parça parça hesaplarken satır bloğu (bellek ~ BLOCK·N byte)
+_BLOCK = 256
+
+
+# -----------------------------
+#  Yardımcı fonksiyonlar
+# -----------------------------
+def objectives_array(individuals: Sequence) -> np.ndarray:
+    """
+    DEAP bireylerinin uygunluklarını (N, M) boyutlu, minimize edilecek
+    bir diziye çevirir. wvalues = values * weights olduğundan -wvalues
+    her amaç için "küçük daha iyi" anlamına gelir.
+    """
+    return -np.asarray([ind.fitness.wvalues for ind in individuals], dtype=float)
+
+
+def _dominates_block(F: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """rows[i] bireyi cols[j] bireyini domine ediyorsa dom[i, j] = True."""
+    a = F[rows][:, None, :]
+    b = F[cols][None, :, :]
+    return np.all(a <= b, axis=2) & np.any(a < b, axis=2)
+
+
+def fast_non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Her satır için Pareto sıra numarasını (0 = ilk cephe) döndürür.
+
+    Baskınlık sayıları bloklar halinde vektörel hesaplanır; ardından cepheler
+    soyulurken yalnızca kalan bireyler üzerinden sayılar güncellenir.
+    """
+    n = F.shape[0]
+    ranks = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return ranks
+
+    all_idx = np.arange(n)
+    dominated_count = np.zeros(n, dtype=np.int64)
+    for s in range(0, n, _BLOCK):
+        rows = all_idx[s:s + _BLOCK]
+        dominated_count += _dominates_block(F, rows, all_idx).sum(axis=0)
+
+    remaining = np.ones(n, dtype=bool)
+    front = np.flatnonzero(dominated_count == 0)
+    rank = 0
+    while front.size:
+        ranks[front] = rank
+        remaining[front] = False
+        rest = np.flatnonzero(remaining)
+        if rest.size == 0:
+            break
+
+        for s in range(0, front.size, _BLOCK):
+            rows = front[s:s + _BLOCK]
+            dominated_count[rest] -= _dominates_block(F, rows, rest).sum(axis=0)
+
+        front = rest[dominated_count[rest] == 0]
+        rank += 1
+
+    return ranks
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """Tek bir cephe için crowding distance (sınır bireyler = inf)."""
+    n, m = F.shape
+    dist = np.zeros(n, dtype=float)
+    if n <= 2:
+        dist[:] = np.inf
+        return dist
+
+    for j in range(m):
+        order = np.argsort(F[:, j], kind="stable")
+        col = F[order, j]
+        span = col[-1] - col[0]
+        dist[order[0]] = np.inf
+        dist[order[-1]] = np.inf
+        if span == 0:
+            continue
+        dist[order[1:-1]] += (col[2:] - col[:-2]) / span
+
+    return dist
+
+
+def split_duplicates(individuals: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Aynı rotayı (aynı ara düğüm dizisini) temsil eden bireyleri ayırır.
+    (ilk görülenlerin indeksleri, tekrar edenlerin indeksleri) döndürür.
+    """
+    seen = set()
+    unique, dup = [], []
+    for i, ind in enumerate(individuals):
+        key = tuple(ind)
+        if key in seen:
+            dup.append(i)
+        else:
+            seen.add(key)
+            unique.append(i)
+    return np.asarray(unique, dtype=np.int64), np.asarray(dup, dtype=np.int64)
+
+
+def _unique_ranks(F: np.ndarray) -> np.ndarray:
+    """Aynı amaç vektörüne sahip satırları (ör. ceza alanlar) bir kez sıralar."""
+    uniq, inverse = np.unique(F, axis=0, return_inverse=True)
+    return fast_non_dominated_sort(uniq)[inverse.reshape(-1)]
+
+
+def _fill_with_duplicates(individuals, chosen, k, unique, ranks, dup):
+    """Tekil bireyler k'yı dolduramadıysa kopyaları, eşlerinin cephesine göre ekler."""
+    if len(chosen) >= k or dup.size == 0:
+        return
+    rank_of_key = {tuple(individuals[i]): r for i, r in zip(unique, ranks)}
+    dup_ranks = np.asarray([rank_of_key[tuple(individuals[i])] for i in dup])
+    order = np.argsort(dup_ranks, kind="stable")
+    chosen.extend(dup[order[: k - len(chosen)]].tolist())
+
+
+# -----------------------------
+#  NSGA-II seçimi
+# -----------------------------
+def sel_nsga2(individuals: Sequence, k: int, dedup: bool = True) -> List:
+    """
+    `tools.selNSGA2` yerine kullanılabilen vektörel NSGA-II seçimi.
+
+    dedup=True ise aynı rotanın kopyaları sıralamaya katılmaz; yalnızca
+    tekil bireyler k'yı dolduramadığında, kendi cephe sıralarına göre
+    listenin sonuna eklenir.
+    """
+    individuals = list(individuals)
+    if k <= 0 or not individuals:
+        return []
+
+    F = objectives_array(individuals)
+
+    if dedup:
+        unique, dup = split_duplicates(individuals)
+    else:
+        unique, dup = np.arange(len(individuals)), np.empty(0, dtype=np.int64)
+
+    ranks = _unique_ranks(F[unique])
+    chosen: List[int] = []
+
+    for r in range(int(ranks.max()) + 1 if ranks.size else 0):
+        front = unique[ranks == r]
+        if len(chosen) + front.size <= k:
+            chosen.extend(front.tolist())
+            if len(chosen) == k:
+                break
+            continue
+
+        # son cephe: crowding distance'a göre azalan sırada kes
+        cd = crowding_distance(F[front])
+        order = np.argsort(-cd, kind="stable")
+        chosen.extend(front[order[: k - len(chosen)]].tolist())
+        break
+
+    _fill_with_duplicates(individuals, chosen, k, unique, ranks, dup)
+    return [individuals[i] for i in chosen]
+
+
+# -----------------------------
+#  NSGA-III (referans nokta) seçimi
+# -----------------------------
+def das_dennis_points(n_obj: int, divisions: int) -> np.ndarray:
+    """Birim simpleks üzerinde eşit aralıklı (Das-Dennis) referans noktaları."""
+    points = []
+
+    def _rec(prefix, left, depth):
+        if depth == n_obj - 1:
+            points.append(prefix + [left])
+            return
+        for i in range(left + 1):
+            _rec(prefix + [i], left - i, depth + 1)
+
+    _rec([], divisions, 0)
+    return np.asarray(points, dtype=float) / divisions
+
+
+def _normalize(F: np.ndarray) -> np.ndarray:
+    """İdeal noktaya göre kaydırıp ekstrem noktaların hiper düzlemiyle ölçekler."""
+    ideal = F.min(axis=0)
+    Ft = F - ideal
+    m = F.shape[1]
+
+    # her eksen için ASF'yi minimize eden ekstrem nokta
+    weights = np.eye(m) + 1e-6
+    asf = np.max(Ft[:, None, :] / weights[None, :, :], axis=2)
+    extremes = Ft[np.argmin(asf, axis=0)]
+
+    worst = Ft.max(axis=0)
+    try:
+        b = np.linalg.solve(extremes, np.ones(m))
+        intercepts = 1.0 / b
+        if not np.all(np.isfinite(intercepts)) or np.any(intercepts <= 1e-10):
+            raise np.linalg.LinAlgError
+    except np.linalg.LinAlgError:
+        intercepts = worst
+
+    intercepts = np.where(intercepts <= 1e-10, 1.0, intercepts)
+    return Ft / intercepts
+
+
+def _associate(Fn: np.ndarray, ref: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Her bireyi en yakın referans doğrusuna bağlar; (niş, dik mesafe) döndürür."""
+    norm = ref / np.linalg.norm(ref, axis=1, keepdims=True)
+    proj = Fn @ norm.T
+    sq = np.sum(Fn ** 2, axis=1, keepdims=True) - proj ** 2
+    dist = np.sqrt(np.maximum(sq, 0.0))
+    niche = np.argmin(dist, axis=1)
+    return niche, dist[np.arange(Fn.shape[0]), niche]
+
+
+def sel_nsga3(
+    individuals: Sequence,
+    k: int,
+    ref_points: np.ndarray | None = None,
+    divisions: int = 12,
+    dedup: bool = True,
+) -> List:
+    """
+    Referans nokta tabanlı NSGA-III seçimi (üç amaç için varsayılan 91 nokta).
+    Son cephe crowding distance yerine niş doluluğuna göre kesilir.
+    """
+    individuals = list(individuals)
+    if k <= 0 or not individuals:
+        return []
+
+    F = objectives_array(individuals)
+    if dedup:
+        unique, dup = split_duplicates(individuals)
+    else:
+        unique, dup = np.arange(len(individuals)), np.empty(0, dtype=np.int64)
+
+    if ref_points is None:
+        ref_points = das_dennis_points(F.shape[1], divisions)
+
+    ranks = _unique_ranks(F[unique])
+    chosen: List[int] = []
+    last_front = np.empty(0, dtype=np.int64)
+
+    for r in range(int(ranks.max()) + 1 if ranks.size else 0):
+        front = unique[ranks == r]
+        if len(chosen) + front.size <= k:
+            chosen.extend(front.tolist())
+            if len(chosen) == k:
+                break
+            continue
+        last_front = front
+        break
+
+    if last_front.size and len(chosen) < k:
+        pool = np.concatenate([np.asarray(chosen, dtype=np.int64), last_front])
+        niche, dist = _associate(_normalize(F[pool]), ref_points)
+
+        n_chosen = len(chosen)
+        niche_count = np.bincount(niche[:n_chosen], minlength=len(ref_points))
+        cand_niche = niche[n_chosen:]
+        cand_dist = dist[n_chosen:]
+        available = np.ones(last_front.size, dtype=bool)
+        active = np.ones(len(ref_points), dtype=bool)
+
+        while len(chosen) < k:
+            # en az dolu (ve hâlâ adayı olan) nişi seç
+            counts = np.where(active, niche_count, np.iinfo(np.int64).max)
+            j_min = np.flatnonzero(counts == counts.min())
+            j = random.choice(j_min.tolist())
+
+            members = np.flatnonzero(available & (cand_niche == j))
+            if members.size == 0:
+                active[j] = False
+                continue
+
+            if niche_count[j] == 0:
+                pick = members[np.argmin(cand_dist[members])]
+            else:
+                pick = random.choice(members.tolist())
+
+            chosen.append(int(last_front[pick]))
+            available[pick] = False
+            niche_count[j] += 1
+
+    _fill_with_duplicates(individuals, chosen, k, unique, ranks, dup)
+    return [individuals[i] for i in chosen]
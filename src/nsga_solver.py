@@ -1,10 +1,12 @@
 import random
-from typing import List, Tuple
+import time
+from typing import Dict, List, Tuple
 
 import networkx as nx
 from deap import base, creator, tools  # algorithms şu an kullanılmıyor ama dursa da olur
 
 from graph_builder import build_graph
+from nsga_selection import sel_nsga2, sel_nsga3
 
 # Geçersiz rotalar için ceza (süre, maliyet, aktarma)
 PENALTY = 10_000.0
@@ -16,17 +18,28 @@ START_NODE: str | None = None
 GOAL_NODE: str | None = None
 MAX_INTERMEDIATE_LEN: int = 4
 GLOBAL_GRAPH: nx.DiGraph | None = None
+CANDIDATE_NODES: List[str] | None = None
 
-# DEAP sınıfları bir kez oluşturulsun (tekrar importta hata vermesin)
-try:
-    creator.FitnessMulti
-except AttributeError:
-    creator.create("FitnessMulti", base.Fitness, weights=(-1.0, -1.0, -1.0))
-    creator.create("Individual", list, fitness=creator.FitnessMulti)
+# Opsiyonel paylaşımlı ön hesaplar (çoklu OD çalıştırmalarında, bkz. nsga_batch):
+#   EDGE_TABLE:    (u, v) -> (süre, maliyet, mod); G'ye sözlük-sözlük erişimi yerine
+#   FITNESS_CACHE: tam rota (tuple) -> (süre, maliyet, aktarma)
+EDGE_TABLE: Dict[Tuple[str, str], Tuple[float, float, str]] | None = None
+FITNESS_CACHE: Dict[Tuple[str, ...], Tuple[float, float, float]] | None = None
 
 toolbox = base.Toolbox()
 
 
+def _ensure_deap_classes():
+    """
+    DEAP sınıflarını ilk kullanımda bir kez oluşturur. Import sırasında
+    `creator` global durumunu değiştirmemek için setup_toolbox'tan çağrılır.
+    """
+    if not hasattr(creator, "FitnessMulti"):
+        creator.create("FitnessMulti", base.Fitness, weights=(-1.0, -1.0, -1.0))
+    if not hasattr(creator, "Individual"):
+        creator.create("Individual", list, fitness=creator.FitnessMulti)
+
+
 # -----------------------------
 #  Yardımcı fonksiyonlar
 # -----------------------------
@@ -35,15 +48,18 @@ def random_path_middle_nodes(G: nx.DiGraph, max_len: int) -> List[str]:
     Sadece ara düğümlerden oluşan bir liste üretir.
     Tam rota: [START_NODE] + middle_nodes + [GOAL_NODE]
     """
-    global START_NODE, GOAL_NODE
+    global START_NODE, GOAL_NODE, CANDIDATE_NODES
     assert START_NODE is not None and GOAL_NODE is not None, "START_NODE/GOAL_NODE set edilmedi."
 
-    nodes = list(G.nodes())
-    # başlangıç ve hedef hariç
-    if START_NODE in nodes:
-        nodes.remove(START_NODE)
-    if GOAL_NODE in nodes:
-        nodes.remove(GOAL_NODE)
+    if CANDIDATE_NODES is not None:
+        nodes = CANDIDATE_NODES
+    else:
+        nodes = list(G.nodes())
+        # başlangıç ve hedef hariç
+        if START_NODE in nodes:
+            nodes.remove(START_NODE)
+        if GOAL_NODE in nodes:
+            nodes.remove(GOAL_NODE)
 
     length = random.randint(0, max_len)  # 0 ara düğüm de olabilir
     middle = []
@@ -92,6 +108,41 @@ def evaluate_path(G: nx.DiGraph, path: List[str]) -> Tuple[float, float, float]:
     return total_time, total_cost, float(transfers)
 
 
+def build_edge_table(G: nx.DiGraph) -> Dict[Tuple[str, str], Tuple[float, float, str]]:
+    """Değerlendirme için düz kenar tablosu: (u, v) -> (süre, maliyet, mod)."""
+    return {
+        (u, v): (d["travel_time"], d["cost"], d["mode"])
+        for u, v, d in G.edges(data=True)
+    }
+
+
+def evaluate_path_table(
+    table: Dict[Tuple[str, str], Tuple[float, float, str]],
+    path: List[str],
+) -> Tuple[float, float, float]:
+    """evaluate_path ile aynı sonuç; grafik yerine önceden kurulmuş kenar tablosunu kullanır."""
+    total_time = 0.0
+    total_cost = 0.0
+    transfers = 0
+
+    last_mode = None
+
+    for u, v in zip(path[:-1], path[1:]):
+        seg = table.get((u, v))
+        if seg is None:
+            return PENALTY, PENALTY, PENALTY
+
+        total_time += seg[0]
+        total_cost += seg[1]
+
+        mode = seg[2]
+        if last_mode is not None and mode != last_mode:
+            transfers += 1
+        last_mode = mode
+
+    return total_time, total_cost, float(transfers)
+
+
 # -----------------------------
 #  DEAP - NSGA-II setup
 # -----------------------------
@@ -119,11 +170,14 @@ def mut_middle(individual):
       - Ara düğüm ekle
       - Ara düğüm sil
     """
-    global GLOBAL_GRAPH, START_NODE, GOAL_NODE, MAX_INTERMEDIATE_LEN
+    global GLOBAL_GRAPH, START_NODE, GOAL_NODE, MAX_INTERMEDIATE_LEN, CANDIDATE_NODES
     G = GLOBAL_GRAPH
     assert G is not None
 
-    all_nodes = [n for n in G.nodes() if n not in (START_NODE, GOAL_NODE)]
+    if CANDIDATE_NODES is not None:
+        all_nodes = CANDIDATE_NODES
+    else:
+        all_nodes = [n for n in G.nodes() if n not in (START_NODE, GOAL_NODE)]
 
     choice = random.random()
 
@@ -147,20 +201,56 @@ def mut_middle(individual):
 
 def evaluate_individual(individual):
     """DEAP evaluate fonksiyonu: birey -> (time, cost, transfers)."""
-    global GLOBAL_GRAPH
+    global GLOBAL_GRAPH, EDGE_TABLE, FITNESS_CACHE
     assert GLOBAL_GRAPH is not None
     full_path = build_full_path(individual)
-    return evaluate_path(GLOBAL_GRAPH, full_path)
 
+    if EDGE_TABLE is None:
+        return evaluate_path(GLOBAL_GRAPH, full_path)
+
+    if FITNESS_CACHE is None:
+        return evaluate_path_table(EDGE_TABLE, full_path)
 
-def setup_toolbox(G: nx.DiGraph, start: str, goal: str, max_intermediate_len: int = 4):
-    """Toolbox içindeki global parametreleri ayarla."""
+    key = tuple(full_path)
+    fit = FITNESS_CACHE.get(key)
+    if fit is None:
+        fit = evaluate_path_table(EDGE_TABLE, full_path)
+        FITNESS_CACHE[key] = fit
+    return fit
+
+
+def setup_toolbox(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    max_intermediate_len: int = 4,
+    selection: str = "nsga2",
+    dedup: bool = True,
+    edge_table=None,
+    fitness_cache=None,
+):
+    """
+    Toolbox içindeki global parametreleri ayarla.
+
+    selection:
+      - "nsga2": NumPy tabanlı hızlı NSGA-II seçimi (varsayılan)
+      - "nsga3": referans noktalı NSGA-III seçimi
+      - "deap":  DEAP'in tools.selNSGA2 fonksiyonu (karşılaştırma için)
+    dedup: aynı rotanın kopyalarını seçimde en sona iter (deap modunda yok sayılır).
+    edge_table / fitness_cache: bkz. build_edge_table; verilmezse grafik doğrudan kullanılır.
+    """
     global GLOBAL_GRAPH, START_NODE, GOAL_NODE, MAX_INTERMEDIATE_LEN
+    global CANDIDATE_NODES, EDGE_TABLE, FITNESS_CACHE
+
+    _ensure_deap_classes()
 
     GLOBAL_GRAPH = G
     START_NODE = start
     GOAL_NODE = goal
     MAX_INTERMEDIATE_LEN = max_intermediate_len
+    CANDIDATE_NODES = [n for n in G.nodes() if n not in (start, goal)]
+    EDGE_TABLE = edge_table
+    FITNESS_CACHE = fitness_cache
 
     def _init_ind():
         middle = random_path_middle_nodes(G, MAX_INTERMEDIATE_LEN)
@@ -171,28 +261,93 @@ def setup_toolbox(G: nx.DiGraph, start: str, goal: str, max_intermediate_len: in
 
     toolbox.register("mate", cx_middle)
     toolbox.register("mutate", mut_middle)
-    toolbox.register("select", tools.selNSGA2)
+    if selection == "nsga2":
+        toolbox.register("select", sel_nsga2, dedup=dedup)
+    elif selection == "nsga3":
+        toolbox.register("select", sel_nsga3, dedup=dedup)
+    elif selection == "deap":
+        toolbox.register("select", tools.selNSGA2)
+    else:
+        raise ValueError(f"Bilinmeyen seçim yöntemi: {selection}")
     toolbox.register("evaluate", evaluate_individual)
 
 
 # -----------------------------
-#  Ana NSGA-II çalıştırma fonksiyonu
+#  Ana NSGA-II çalıştırma fonksiyonları
 # -----------------------------
-def run_nsga2(
+def front_solutions(G: nx.DiGraph, hof) -> List[dict]:
+    """Hall of fame bireylerinden ceza almamış (geçerli) çözüm sözlüklerini üretir."""
+    solutions = []
+    for ind in hof:
+        full_path = build_full_path(ind)
+        t, c, tr = evaluate_path(G, full_path)
+        solutions.append(
+            {
+                "middle_nodes": list(ind),
+                "full_path": full_path,
+                "total_time": t,
+                "total_cost": c,
+                "transfers": tr,
+            }
+        )
+
+    # Ceza almış (geçersiz) rotaları filtrele
+    return [
+        s for s in solutions
+        if s["total_time"] < PENALTY and s["total_cost"] < PENALTY
+    ]
+
+
+def iter_nsga2(
     G: nx.DiGraph,
     start: str,
     goal: str,
     n_generations: int = 40,
     pop_size: int = 40,
     max_intermediate_len: int = 4,
+    selection: str = "nsga2",
+    dedup: bool = True,
+    every: int = 1,
+    should_stop=None,
+    initial_middles=None,
+    edge_table=None,
+    fitness_cache=None,
 ):
     """
-    Verilen start-goal için NSGA-II'yi çalıştır ve
-    ceza almamış (geçerli) Pareto front çözümlerini döndür.
+    NSGA-II'yi nesil nesil çalıştıran generator.
+
+    İlk nesilde, her `every` nesilde bir ve son nesilde şu sözlüğü üretir:
+      - generation, n_generations
+      - front:    o ana kadarki geçerli Pareto çözümleri (run_nsga2 biçiminde)
+      - hof_size: hall of fame boyutu (geçersizler dahil)
+      - elapsed:  başlangıçtan beri geçen süre (sn)
+
+    İptal: tüketici döngüden çıkabilir / generator'ı kapatabilir ya da
+    `should_stop()` True döndürdüğünde döngü o nesilden sonra biter.
+    Son üretilen "front", aynı tohumla run_nsga2'nin döndürdüğüyle aynıdır.
+
+    initial_middles: başlangıç popülasyonuna konacak ara düğüm listeleri
+    (ör. en kısa yol ağaçlarından gelen rotalar); kalan bireyler rastgele.
+    edge_table / fitness_cache: bkz. setup_toolbox.
+
+    Not: toolbox ve START/GOAL modül seviyesinde tutulduğundan aynı süreçte
+    aynı anda yalnızca bir çalıştırma ilerletilmelidir.
     """
-    setup_toolbox(G, start, goal, max_intermediate_len)
+    t0 = time.perf_counter()
+    setup_toolbox(
+        G,
+        start,
+        goal,
+        max_intermediate_len,
+        selection=selection,
+        dedup=dedup,
+        edge_table=edge_table,
+        fitness_cache=fitness_cache,
+    )
 
     pop = toolbox.population(n=pop_size)
+    for i, middle in enumerate((initial_middles or [])[:pop_size]):
+        pop[i] = creator.Individual(list(middle)[:max_intermediate_len])
     hof = tools.ParetoFront()
 
     # İlk popülasyonun uygunluklarını hesapla
@@ -224,32 +379,63 @@ def run_nsga2(
         for ind, fit in zip(invalid_ind, fitnesses):
             ind.fitness.values = fit
 
-        pop = offspring
+        # elitist seçim: ebeveynler + çocuklar arasından en iyi pop_size birey
+        pop = toolbox.select(pop + offspring, pop_size)
         hof.update(pop)
 
-        if gen % 10 == 0 or gen == 1 or gen == n_generations:
-            print(f"Generation {gen} tamamlandı, hof boyutu: {len(hof)}")
-
-    # Pareto front çözümlerini çıkar
-    solutions = []
-    for ind in hof:
-        full_path = build_full_path(ind)
-        t, c, tr = evaluate_path(G, full_path)
-        solutions.append(
-            {
-                "middle_nodes": list(ind),
-                "full_path": full_path,
-                "total_time": t,
-                "total_cost": c,
-                "transfers": tr,
+        stop = should_stop is not None and should_stop()
+        # ilk nesil her zaman üretilir: arayüz ilk sonucu hemen gösterebilsin
+        if gen == 1 or gen % every == 0 or gen == n_generations or stop:
+            yield {
+                "generation": gen,
+                "n_generations": n_generations,
+                "front": front_solutions(G, hof),
+                "hof_size": len(hof),
+                "elapsed": time.perf_counter() - t0,
             }
-        )
+        if stop:
+            return
 
-    # Ceza almış (geçersiz) rotaları filtrele
-    valid_solutions = [
-        s for s in solutions
-        if s["total_time"] < PENALTY and s["total_cost"] < PENALTY
-    ]
+
+def run_nsga2(
+    G: nx.DiGraph,
+    start: str,
+    goal: str,
+    n_generations: int = 40,
+    pop_size: int = 40,
+    max_intermediate_len: int = 4,
+    selection: str = "nsga2",
+    dedup: bool = True,
+    verbose: bool = True,
+    initial_middles=None,
+    edge_table=None,
+    fitness_cache=None,
+):
+    """
+    Verilen start-goal için NSGA-II'yi çalıştır ve
+    ceza almamış (geçerli) Pareto front çözümlerini döndür.
+
+    Her nesilde ebeveyn + çocuk birleşiminden `pop_size` birey seçilir
+    (seçim yöntemi için bkz. setup_toolbox). Ara sonuçlar için iter_nsga2.
+    """
+    valid_solutions = []
+    for state in iter_nsga2(
+        G,
+        start,
+        goal,
+        n_generations=n_generations,
+        pop_size=pop_size,
+        max_intermediate_len=max_intermediate_len,
+        selection=selection,
+        dedup=dedup,
+        every=10,
+        initial_middles=initial_middles,
+        edge_table=edge_table,
+        fitness_cache=fitness_cache,
+    ):
+        valid_solutions = state["front"]
+        if verbose:
+            print(f"Generation {state['generation']} tamamlandı, hof boyutu: {state['hof_size']}")
 
     return valid_solutions
 
@@ -0,0 +1,514 @@
+"""
+CRP (Customizable Route Planning) benzeri çok seviyeli overlay.
+
+Üç aşama:
+  1) build_overlay:  metrikten bağımsız ön işleme (bir kez). Düğümler
+     koordinatlara göre iç içe hücrelere bölünür. Her seviyede her hücre
+     için küçük bir "hücre grafı" (CSR) kurulur:
+       - seviye 0: hücredeki düğümler ve hücre içi orijinal kenarlar
+       - seviye l: alt seviyenin sınır düğümleri; yaylar alt seviyenin
+         kısayolları (clique) + alt hücreler arası kenarlar
+     En üstte tüm grafı kapsayan tek bir global hücre bulunur.
+  2) customize:      profil başına (α·süre + β·maliyet, kapalı modlar)
+     her hücrede sınır düğümlerinden scipy Dijkstra çalıştırılır; sınır-
+     sınır mesafeleri bir üst seviyenin kısayol ağırlıkları olur, öncül
+     matrisleri kısayolları açmak için saklanır. Sonuç overlay içinde
+     profil anahtarıyla önbelleğe alınır.
+  3) query_overlay:  her seviyede yalnızca start ve goal'un hücre grafları
+     aranır (ileri / geri); alt seviyedeki mesafeler sanal bir kaynak
+     düğümle bir üst seviyeye taşınır. Rota, saklanan öncüllerle orijinal
+     kenarlara açılır.
+"""
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from utils import load_default_graph, path_stats
+
+
+INF = math.inf
+
+# Hazır profiller (istemci uygulamaları isimle seçebilir)
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "fastest": {"alpha": 1.0, "beta": 0.0, "disabled_modes": []},
+    "balanced": {"alpha": 1.0, "beta": 0.5, "disabled_modes": []},
+    "cheapest": {"alpha": 0.1, "beta": 1.0, "disabled_modes": []},
+    "no_car": {"alpha": 1.0, "beta": 0.0, "disabled_modes": ["car"]},
+}
+
+# Hücre grafı yay türleri
+ARC_EDGE = 0  # orijinal kenar (ref: kenar indeksi)
+ARC_SHORTCUT = 1  # alt seviyenin kısayolu (ref: alt seviyedeki kısayol indeksi)
+
+
+# -----------------------------
+#  1) Metrikten bağımsız ön işleme
+# -----------------------------
+def _partition(x: np.ndarray, y: np.ndarray, cell_sizes: Sequence[int]) -> np.ndarray:
+    """
+    Koordinat ikiye bölmesiyle iç içe hücreler üretir.
+    cells[l, i] = i düğümünün l. seviyedeki hücre numarası (0 = en ince seviye).
+    """
+    n_levels = len(cell_sizes)
+    cells = np.full((n_levels, x.size), -1, dtype=np.int64)
+    counters = [0] * n_levels
+
+    def _rec(ids: np.ndarray, level: int):
+        # bu grup hangi seviyelerde tek hücreye sığıyorsa orada hücre olur
+        while level >= 0 and ids.size <= cell_sizes[level]:
+            cells[level, ids] = counters[level]
+            counters[level] += 1
+            level -= 1
+        if level < 0:
+            return
+
+        # yayılımı büyük olan eksende medyandan böl
+        xs, ys = x[ids], y[ids]
+        coord = xs if np.ptp(xs) >= np.ptp(ys) else ys
+        order = np.argsort(coord, kind="stable")
+        half = ids.size // 2
+        _rec(ids[order[:half]], level)
+        _rec(ids[order[half:]], level)
+
+    _rec(np.arange(x.size), n_levels - 1)
+    return cells
+
+
+def _build_layer(
+    cell: np.ndarray,
+    is_vert: np.ndarray,
+    is_boundary: np.ndarray,
+    a_tail: np.ndarray,
+    a_head: np.ndarray,
+    a_kind: np.ndarray,
+    a_ref: np.ndarray,
+) -> Dict[str, Any]:
+    """
+    Bir seviyenin hücre graflarını kurar.
+
+    cell:        düğüm -> bu seviyedeki hücre
+    is_vert:     hücre graflarının düğümleri (seviye 0'da tümü)
+    is_boundary: bu seviyenin sınır düğümleri (kısayol uçları)
+    a_*:         yaylar (uçları aynı hücrede), tür ve referans
+    """
+    n_cells = int(cell.max()) + 1
+    verts = np.flatnonzero(is_vert)
+    verts = verts[np.argsort(cell[verts], kind="stable")]
+    v_start = np.searchsorted(cell[verts], np.arange(n_cells + 1))
+
+    local = np.full(cell.size, -1, dtype=np.int64)
+    local[verts] = np.arange(verts.size) - v_start[cell[verts]]
+
+    a_cell = cell[a_tail]
+    l_tail, l_head = local[a_tail], local[a_head]
+    order = np.lexsort((l_head, l_tail, a_cell))
+    a_cell, l_tail, l_head = a_cell[order], l_tail[order], l_head[order]
+    a_kind, a_ref = a_kind[order], a_ref[order]
+    a_start = np.searchsorted(a_cell, np.arange(n_cells + 1))
+
+    bnodes = np.flatnonzero(is_boundary)
+    bnodes = bnodes[np.argsort(cell[bnodes], kind="stable")]
+    b_start = np.searchsorted(cell[bnodes], np.arange(n_cells + 1))
+
+    cells = []
+    slot_tail, slot_head, slot_cell, slot_row, slot_col = [], [], [], [], []
+    n_slots = 0
+    for c in range(n_cells):
+        n = int(v_start[c + 1] - v_start[c])
+        a0, a1 = a_start[c], a_start[c + 1]
+        tails, heads = l_tail[a0:a1], l_head[a0:a1]
+
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+        perm_t = np.lexsort((tails, heads)).astype(np.int32)
+        indptr_t = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(heads, minlength=n), out=indptr_t[1:])
+
+        b_global = bnodes[b_start[c] : b_start[c + 1]]
+        b_local = local[b_global]
+        k = b_global.size
+        rows, cols = np.nonzero(~np.eye(k, dtype=bool))  # satır sırasıyla (i, j), i != j
+
+        cells.append(
+            {
+                "verts": verts[v_start[c] : v_start[c + 1]],
+                "arcs": (int(a0), int(a1)),
+                "indptr": indptr,
+                "indices": heads.astype(np.int32),
+                "indptr_t": indptr_t,
+                "indices_t": tails[perm_t].astype(np.int32),
+                "perm_t": perm_t,
+                "boundary": b_global,
+                "boundary_local": b_local,
+                "slots": (n_slots, n_slots + rows.size),
+            }
+        )
+        slot_tail.append(b_global[rows])
+        slot_head.append(b_global[cols])
+        slot_cell.append(np.full(rows.size, c, dtype=np.int64))
+        slot_row.append(rows)
+        slot_col.append(b_local[cols])
+        n_slots += rows.size
+
+    def _cat(parts):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    return {
+        "cells": cells,
+        "local": local,
+        "arc_kind": a_kind,
+        "arc_ref": a_ref,
+        "slot_tail": _cat(slot_tail),
+        "slot_head": _cat(slot_head),
+        "slot_cell": _cat(slot_cell),
+        "slot_row": _cat(slot_row),
+        "slot_col": _cat(slot_col),
+    }
+
+
+def build_overlay(G: nx.DiGraph, cell_sizes: Sequence[int] = (32, 512)) -> Dict[str, Any]:
+    """
+    Metrikten bağımsız overlay yapısını kurar.
+
+    cell_sizes: her seviyedeki en büyük hücre boyutu (küçükten büyüğe).
+    Küçük graflarda seviyeler tek hücreye düşebilir; bu durumda sorgu
+    doğrudan o hücrenin grafı üzerinde çalışır.
+    """
+    cell_sizes = sorted(cell_sizes)
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    x = np.asarray([G.nodes[n]["x"] for n in nodes], dtype=float)
+    y = np.asarray([G.nodes[n]["y"] for n in nodes], dtype=float)
+
+    tail, head, modes, times, costs = [], [], [], [], []
+    for u, v, data in G.edges(data=True):
+        tail.append(index[u])
+        head.append(index[v])
+        modes.append(data["mode"])
+        times.append(data["travel_time"])
+        costs.append(data["cost"])
+
+    tail_arr = np.asarray(tail, dtype=np.int64)
+    head_arr = np.asarray(head, dtype=np.int64)
+    edge_ids = np.arange(tail_arr.size)
+
+    # en üstte tüm grafı kapsayan tek bir global hücre
+    cells = np.vstack([_partition(x, y, cell_sizes), np.zeros((1, len(nodes)), dtype=np.int64)])
+
+    layers = []
+    for level in range(len(cells)):
+        cell = cells[level]
+        same_cell = cell[tail_arr] == cell[head_arr]
+
+        if level == 0:
+            is_vert = np.ones(len(nodes), dtype=bool)
+            a_tail, a_head = tail_arr[same_cell], head_arr[same_cell]
+            a_kind = np.full(a_tail.size, ARC_EDGE, dtype=np.int8)
+            a_ref = edge_ids[same_cell]
+        else:
+            lower = layers[-1]
+            lower_cut = cells[level - 1][tail_arr] != cells[level - 1][head_arr]
+            cut = lower_cut & same_cell
+            is_vert = np.zeros(len(nodes), dtype=bool)
+            is_vert[lower["slot_tail"]] = True
+            is_vert[tail_arr[lower_cut]] = True
+            is_vert[head_arr[lower_cut]] = True
+            a_tail = np.concatenate([lower["slot_tail"], tail_arr[cut]])
+            a_head = np.concatenate([lower["slot_head"], head_arr[cut]])
+            a_kind = np.concatenate(
+                [
+                    np.full(lower["slot_tail"].size, ARC_SHORTCUT, dtype=np.int8),
+                    np.full(int(cut.sum()), ARC_EDGE, dtype=np.int8),
+                ]
+            )
+            a_ref = np.concatenate([np.arange(lower["slot_tail"].size), edge_ids[cut]])
+
+        is_boundary = np.zeros(len(nodes), dtype=bool)
+        is_boundary[tail_arr[~same_cell]] = True
+        is_boundary[head_arr[~same_cell]] = True
+
+        layers.append(_build_layer(cell, is_vert, is_boundary, a_tail, a_head, a_kind, a_ref))
+
+    return {
+        "nodes": nodes,
+        "index": index,
+        "cell_sizes": list(cell_sizes),
+        "cells": cells,
+        "tail": tail_arr,
+        "head": head_arr,
+        "modes": np.asarray(modes),
+        "travel_time": np.asarray(times, dtype=float),
+        "cost": np.asarray(costs, dtype=float),
+        "layers": layers,
+        "metrics": {},
+    }
+
+
+# -----------------------------
+#  2) Profil başına customization
+# -----------------------------
+def profile_key(profile: Dict[str, Any]) -> Tuple[float, float, frozenset]:
+    """Profilin önbellek anahtarı (isimden bağımsız, yalnızca ağırlıklar)."""
+    return (
+        float(profile.get("alpha", 1.0)),
+        float(profile.get("beta", 0.0)),
+        frozenset(profile.get("disabled_modes", ())),
+    )
+
+
+def _cell_matrix(cg, data: np.ndarray, reverse: bool = False) -> csr_matrix:
+    """Hücre grafının (veya tersinin) verilen yay ağırlıklarıyla CSR matrisi."""
+    n = cg["indptr"].size - 1
+    if reverse:
+        return csr_matrix((data[cg["perm_t"]], cg["indices_t"], cg["indptr_t"]), shape=(n, n))
+    return csr_matrix((data, cg["indices"], cg["indptr"]), shape=(n, n))
+
+
+def customize(overlay: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Profil için kenar ağırlıklarını ve tüm seviyelerin hücre içi kısayollarını
+    hesaplar. Seviyeler alttan üste kurulur: her seviye bir alttakinin
+    kısayollarını kullandığı için üst seviyeler küçük graflar üzerinde çalışır.
+
+    Dönen metrik:
+      - weight:       kenar ağırlıkları
+      - arc_weight:   seviye başına hücre grafı yay ağırlıkları
+      - slot_weight:  seviye başına kısayol ağırlıkları
+      - pred:         seviye / hücre başına kısayol öncül matrisleri
+    """
+    alpha, beta, disabled = profile_key(profile)
+
+    weight = alpha * overlay["travel_time"] + beta * overlay["cost"]
+    if disabled:
+        weight = np.where(np.isin(overlay["modes"], list(disabled)), INF, weight)
+
+    metric = {"weight": weight, "arc_weight": [], "slot_weight": [], "pred": []}
+
+    lower_slots = np.empty(0)
+    for layer in overlay["layers"]:
+        is_edge = layer["arc_kind"] == ARC_EDGE
+        arc_weight = np.where(is_edge, weight[np.where(is_edge, layer["arc_ref"], 0)], 0.0)
+        if lower_slots.size:
+            arc_weight[~is_edge] = lower_slots[layer["arc_ref"][~is_edge]]
+
+        slot_weight = np.empty(layer["slot_tail"].size)
+        preds = []
+        for cg in layer["cells"]:
+            b_local = cg["boundary_local"]
+            if b_local.size == 0:
+                preds.append(None)
+                continue
+            a0, a1 = cg["arcs"]
+            dist, pred = dijkstra(
+                _cell_matrix(cg, arc_weight[a0:a1]), indices=b_local, return_predecessors=True
+            )
+            s0, s1 = cg["slots"]
+            slot_weight[s0:s1] = dist[:, b_local][~np.eye(b_local.size, dtype=bool)]
+            preds.append(pred)
+
+        metric["arc_weight"].append(arc_weight)
+        metric["slot_weight"].append(slot_weight)
+        metric["pred"].append(preds)
+        lower_slots = slot_weight
+
+    return metric
+
+
+def get_metric(overlay: Dict[str, Any], profile) -> Dict[str, Any]:
+    """Profil (isim veya sözlük) için önbellekteki metriği döndürür, yoksa hesaplar."""
+    if isinstance(profile, str):
+        profile = PROFILES[profile]
+
+    key = profile_key(profile)
+    metric = overlay["metrics"].get(key)
+    if metric is None:
+        metric = customize(overlay, profile)
+        overlay["metrics"][key] = metric
+    return metric
+
+
+# -----------------------------
+#  3) Sorgu
+# -----------------------------
+def _cell_search(cg, data: np.ndarray, source, reverse: bool):
+    """
+    Hücre grafında tek kaynaklı Dijkstra (reverse=True ise ters yaylarla).
+
+    source: yerel düğüm indeksi (int) ya da (yerel düğümler, başlangıç
+    mesafeleri); ikinci durumda n numaralı sanal bir kaynak eklenir.
+    (dist, pred) döndürür; pred'de n sanal kaynağı gösterir.
+    """
+    if isinstance(source, int):
+        return dijkstra(_cell_matrix(cg, data, reverse), indices=source, return_predecessors=True)
+
+    locs, init = source
+    n = cg["indptr"].size - 1
+    if reverse:
+        indptr, indices, data = cg["indptr_t"], cg["indices_t"], data[cg["perm_t"]]
+    else:
+        indptr, indices = cg["indptr"], cg["indices"]
+
+    m = csr_matrix(
+        (
+            np.concatenate([data, init]),
+            np.concatenate([indices, locs]),
+            np.append(indptr, indptr[-1] + locs.size),
+        ),
+        shape=(n + 1, n + 1),
+    )
+    return dijkstra(m, indices=n, return_predecessors=True)
+
+
+def _arc_at(overlay, level: int, cg, a: int, b: int) -> Tuple[int, int]:
+    """Hücre grafında a -> b yayının (tür, referans) bilgisi."""
+    lo, hi = cg["indptr"][a], cg["indptr"][a + 1]
+    pos = cg["arcs"][0] + lo + int(np.searchsorted(cg["indices"][lo:hi], b))
+    layer = overlay["layers"][level]
+    return int(layer["arc_kind"][pos]), int(layer["arc_ref"][pos])
+
+
+def _unpack_chain(overlay, metric, level: int, cg, chain: List[int], out: List[int]):
+    """Hücre grafındaki yerel düğüm zincirini orijinal kenar listesine açar."""
+    for a, b in zip(chain[:-1], chain[1:]):
+        kind, ref = _arc_at(overlay, level, cg, a, b)
+        if kind == ARC_EDGE:
+            out.append(ref)
+        else:
+            _unpack_slot(overlay, metric, level - 1, ref, out)
+
+
+def _unpack_slot(overlay, metric, level: int, slot: int, out: List[int]):
+    """Bir kısayolu, customization'da saklanan öncüllerle orijinal kenarlara açar."""
+    layer = overlay["layers"][level]
+    c = int(layer["slot_cell"][slot])
+    row = int(layer["slot_row"][slot])
+    cg = layer["cells"][c]
+    pred = metric["pred"][level][c][row]
+
+    source = int(cg["boundary_local"][row])
+    chain = [int(layer["slot_col"][slot])]
+    while chain[-1] != source:
+        chain.append(int(pred[chain[-1]]))
+    chain.reverse()
+    _unpack_chain(overlay, metric, level, cg, chain, out)
+
+
+def _trace(overlay, metric, searches, level: int, node: int, reverse: bool, out: List[int]):
+    """
+    İleri aramada start -> node, geri aramada node -> goal parçasını
+    seviye seviye izleyip orijinal kenarlara açar.
+    """
+    cg, pred, _ = searches[level]
+    n = cg["indptr"].size - 1
+    chain = [int(overlay["layers"][level]["local"][node])]
+    while pred[chain[-1]] >= 0 and pred[chain[-1]] != n:
+        chain.append(int(pred[chain[-1]]))
+
+    if reverse:
+        # geri aramanın öncülleri goal'a doğru ilerler: zincir zaten ileri yönde
+        _unpack_chain(overlay, metric, level, cg, chain, out)
+        if level > 0:
+            _trace(overlay, metric, searches, level - 1, int(cg["verts"][chain[-1]]), True, out)
+        return
+
+    chain.reverse()
+    if level > 0:
+        _trace(overlay, metric, searches, level - 1, int(cg["verts"][chain[0]]), False, out)
+    _unpack_chain(overlay, metric, level, cg, chain, out)
+
+
+def query_overlay(
+    overlay: Dict[str, Any],
+    start: str,
+    goal: str,
+    profile="fastest",
+):
+    """
+    Profil ağırlığını minimize eden rotayı bulur.
+    solve_astar_constrained gibi (path, total_time, total_cost) döndürür;
+    rota yoksa (None, None, None).
+
+    Her seviyede start'ın hücresinde ileri, goal'un hücresinde geri arama
+    yapılır; alt seviyenin sınır mesafeleri sanal kaynakla bir üst seviyeye
+    aktarılır. start ve goal'un aynı hücrede olduğu her seviye (en üstte
+    global hücre her zaman) bir aday mesafe verir; en küçüğü seçilir.
+    """
+    metric = get_metric(overlay, profile)
+    layers = overlay["layers"]
+    cells = overlay["cells"]
+    s = overlay["index"][start]
+    t = overlay["index"][goal]
+    if s == t:
+        return [start], 0.0, 0.0
+
+    fwd, bwd = [], []
+    up = down = None
+    best, best_level, best_via = INF, -1, -1
+    for level, layer in enumerate(layers):
+        local = layer["local"]
+        data = metric["arc_weight"][level]
+        cs, ct = int(cells[level, s]), int(cells[level, t])
+
+        cg = layer["cells"][cs]
+        a0, a1 = cg["arcs"]
+        src = int(local[s]) if up is None else (local[up[0]], up[1])
+        dist, pred = _cell_search(cg, data[a0:a1], src, reverse=False)
+        fwd.append((cg, pred, dist))
+
+        if cs == ct:
+            if level == 0:
+                cand, via = dist[local[t]], t
+            elif down[0].size:
+                total = dist[local[down[0]]] + down[1]
+                i = int(np.argmin(total))
+                cand, via = total[i], int(down[0][i])
+            else:
+                cand = INF
+            if cand < best:
+                best, best_level, best_via = float(cand), level, via
+
+        if level == len(layers) - 1:
+            break
+
+        up = (cg["boundary"], dist[cg["boundary_local"]])
+        cg_t = layer["cells"][ct]
+        a0, a1 = cg_t["arcs"]
+        src = int(local[t]) if down is None else (local[down[0]], down[1])
+        dist_t, pred_t = _cell_search(cg_t, data[a0:a1], src, reverse=True)
+        bwd.append((cg_t, pred_t, dist_t))
+        down = (cg_t["boundary"], dist_t[cg_t["boundary_local"]])
+
+    if best == INF:
+        return None, None, None
+
+    # start -> via (ileri aramalar) + via -> goal (geri aramalar)
+    edges: List[int] = []
+    _trace(overlay, metric, fwd, best_level, best_via, False, edges)
+    if best_level > 0:
+        _trace(overlay, metric, bwd, best_level - 1, best_via, True, edges)
+
+    nodes = overlay["nodes"]
+    head = overlay["head"]
+    path = [start] + [nodes[head[e]] for e in edges]
+    total_time = float(overlay["travel_time"][edges].sum())
+    total_cost = float(overlay["cost"][edges].sum())
+    return path, total_time, total_cost
+
+
+if __name__ == "__main__":
+    G = load_default_graph()
+    overlay = build_overlay(G, cell_sizes=(3, 6))
+
+    for name in PROFILES:
+        p, t, c = query_overlay(overlay, "N6", "N8", profile=name)
+        print(f"[{name}]")
+        if p is None:
+            print("  Rota yok")
+            continue
+        stats = path_stats(G, p)
+        print("  Rota:", " -> ".join(p))
+        print(f"  Süre: {t} dk, Maliyet: {c} TL, Aktarma: {stats['transfers']}")
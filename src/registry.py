@@ -0,0 +1,174 @@
+"""
+Algoritma kayıt defteri (solver registry).
+
+Algoritmalar isimle ve metadata ile kaydedilir; modülleri (ve onların ağır
+bağımlılıkları: DEAP, NumPy vb.) yalnızca ilk kullanımda import edilir.
+Bu modül bilerek yalnızca standart kütüphaneyi import eder, böylece
+arayüz/CLI açılışı hangi algoritma kullanılacaksa onun maliyetini öder.
+
+Kullanım:
+    from registry import get_solver, get_graph
+
+    solve = get_solver("astar")
+    path, t, c = solve(get_graph(), "N6", "N8")
+"""
+import csv
+import importlib
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+# Varsayılan veri klasörü (utils.DATA_DIR ile aynı; utils pandas'ı yüklediği için import edilmez)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+# isim -> metadata (module, function, label, description, extras)
+SOLVERS: Dict[str, Dict[str, Any]] = {}
+
+# Yüklenmiş fonksiyonlar (isim -> callable)
+_LOADED: Dict[str, Callable] = {}
+
+# extras -> kurulum dosyası (bkz. requirements-*.txt)
+EXTRAS_REQUIREMENTS = {
+    "optim": "requirements-optim.txt",
+    "viz": "requirements-viz.txt",
+    "web": "requirements-web.txt",
+    "io": "requirements-io.txt",
+}
+
+
+def register_solver(
+    name: str,
+    module: str,
+    function: str,
+    label: str = "",
+    description: str = "",
+    extras=(),
+):
+    """
+    Bir algoritmayı import etmeden kaydeder.
+
+    module/function: "astar_solver" / "solve_astar_constrained" gibi
+    extras: ihtiyaç duyduğu opsiyonel bağımlılık grupları (ör. ("optim",))
+    """
+    SOLVERS[name] = {
+        "name": name,
+        "module": module,
+        "function": function,
+        "label": label or name,
+        "description": description,
+        "extras": tuple(extras),
+    }
+    _LOADED.pop(name, None)
+
+
+def list_solvers() -> List[Dict[str, Any]]:
+    """Kayıtlı algoritmaların metadata listesi (import yapmaz)."""
+    return list(SOLVERS.values())
+
+
+def get_solver(name: str) -> Callable:
+    """Algoritmanın fonksiyonunu döndürür; modülü ilk çağrıda import eder."""
+    fn = _LOADED.get(name)
+    if fn is not None:
+        return fn
+
+    if name not in SOLVERS:
+        raise KeyError(f"Kayıtlı olmayan algoritma: {name}")
+    meta = SOLVERS[name]
+
+    try:
+        module = importlib.import_module(meta["module"])
+    except ImportError as exc:
+        hints = [EXTRAS_REQUIREMENTS[e] for e in meta["extras"] if e in EXTRAS_REQUIREMENTS]
+        hint = f" (kurulum: pip install -r {', '.join(hints)})" if hints else ""
+        raise ImportError(f"'{name}' algoritması yüklenemedi: {exc}{hint}") from exc
+
+    fn = getattr(module, meta["function"])
+    _LOADED[name] = fn
+    return fn
+
+
+@lru_cache(maxsize=None)
+def get_graph(time_dependent: bool = False):
+    """
+    Varsayılan grafı ilk çağrıda yükler ve süreç boyunca paylaşır.
+    Dönen graf ortak olduğu için çağıranlar onu değiştirmemelidir.
+    """
+    from utils import load_default_graph
+
+    return load_default_graph(time_dependent=time_dependent)
+
+
+@lru_cache(maxsize=None)
+def get_node_names() -> Dict[str, str]:
+    """
+    Varsayılan verideki düğüm id -> isim eşlemesi (dosya sırasıyla).
+    nodes.csv standart kütüphaneyle okunur; arayüzün seçim kutuları için
+    grafı (ve pandas'ı) yüklemeye gerek kalmaz.
+    """
+    with open(os.path.join(DATA_DIR, "nodes.csv"), newline="", encoding="utf-8") as f:
+        return {row["node_id"]: row["name"] for row in csv.DictReader(f)}
+
+
+# -----------------------------
+#  Yerleşik algoritmalar
+# -----------------------------
+register_solver(
+    "astar",
+    "astar_solver",
+    "solve_astar_constrained",
+    label="A* (kısıtlı)",
+    description="Süreyi minimize eder; mod, max süre ve max maliyet kısıtları.",
+)
+register_solver(
+    "astar_simple",
+    "astar_solver",
+    "solve_astar_simple",
+    label="A* (yalın)",
+    description="NetworkX A*, yalnızca travel_time.",
+)
+register_solver(
+    "astar_td",
+    "astar_solver",
+    "solve_astar_time_dependent",
+    label="A* (zamana bağlı)",
+    description="Kalkış saatine göre en erken varış (saat profilleri).",
+)
+register_solver(
+    "raptor",
+    "raptor_solver",
+    "raptor_like",
+    label="RAPTOR-benzeri",
+    description="Round bazlı en erken varış (basitleştirilmiş).",
+)
+register_solver(
+    "nsga2",
+    "nsga_solver",
+    "run_nsga2",
+    label="NSGA-II (çok amaçlı)",
+    description="Süre, maliyet ve aktarma için Pareto çözümleri.",
+    extras=("optim",),
+)
+register_solver(
+    "nsga2_stream",
+    "nsga_solver",
+    "iter_nsga2",
+    label="NSGA-II (nesil nesil)",
+    description="run_nsga2'nin her nesilde ara sonuç üreten sürümü.",
+    extras=("optim",),
+)
+register_solver(
+    "alternatives",
+    "alternatives",
+    "alternative_routes",
+    label="Alternatif rotalar",
+    description="Yen k-en kısa veya via-node alternatifleri.",
+)
+register_solver(
+    "isochrone",
+    "isochrone",
+    "reachable_within",
+    label="Erişim alanı",
+    description="Süre bütçesi içindeki tüm düğümler (Dial kuyruğu).",
+)
@@ -11,11 +11,15 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
 
-def load_default_graph() -> nx.DiGraph:
-    """data/nodes.csv ve data/edges.csv'den varsayılan grafı yükler."""
+def load_default_graph(time_dependent: bool = False) -> nx.DiGraph:
+    """
+    data/nodes.csv ve data/edges.csv'den varsayılan grafı yükler.
+    time_dependent=True ise data/edge_profiles.csv'deki saat profilleri de eklenir.
+    """
     nodes_path = os.path.join(DATA_DIR, "nodes.csv")
     edges_path = os.path.join(DATA_DIR, "edges.csv")
-    return build_graph(nodes_path, edges_path)
+    profiles_path = os.path.join(DATA_DIR, "edge_profiles.csv") if time_dependent else None
+    return build_graph(nodes_path, edges_path, profiles_path)
 
 
 def path_stats(G: nx.DiGraph, path: List[str]) -> Dict[str, Any]:
@@ -67,3 +71,63 @@ def path_stats(G: nx.DiGraph, path: List[str]) -> Dict[str, Any]:
         "transfers": transfers,
         "modes": modes,
     }
+
+
+def synthetic_city_graph(rows: int, cols: int, seed: int = 0) -> nx.DiGraph:
+    """
+    Benchmark'lar için build_graph ile aynı attribute'lara sahip yapay bir şehir.
+
+    Izgara üzerinde her komşu çifti arasında walk/bike/car kenarlarından biri,
+    her 5. satırda otobüs, her 10. sütunda metro hattı bulunur. Kenarlar
+    build_graph'taki gibi iki yönlüdür.
+    """
+    import random
+
+    rng = random.Random(seed)
+    G = nx.DiGraph()
+
+    def nid(r, c):
+        return f"N{r * cols + c + 1}"
+
+    for r in range(rows):
+        for c in range(cols):
+            G.add_node(
+                nid(r, c),
+                name=f"S{r}_{c}",
+                x=c * 0.1,
+                y=r * 0.1,
+                has_metro=int(c % 10 == 0),
+                has_bus=int(r % 5 == 0),
+                has_train=0,
+                has_bike=int(rng.random() < 0.3),
+            )
+
+    def add(u, v, mode, minutes, cost, distance):
+        attrs = dict(
+            mode=mode,
+            travel_time=float(minutes),
+            cost=float(cost),
+            distance=float(distance),
+            is_transfer=0,
+        )
+        G.add_edge(u, v, **attrs)
+        if not G.has_edge(v, u):
+            G.add_edge(v, u, **attrs)
+
+    street = [("walk", 6, 0), ("bike", 3, 2), ("car", 2, 8)]
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0)):
+                r2, c2 = r + dr, c + dc
+                if r2 >= rows or c2 >= cols:
+                    continue
+                u, v = nid(r, c), nid(r2, c2)
+                if dr == 0 and r % 5 == 0:
+                    add(u, v, "bus", 2 + rng.randint(0, 2), 1, 300)
+                elif dc == 0 and c % 10 == 0:
+                    add(u, v, "metro", 1, 1, 300)
+                else:
+                    mode, minutes, cost = rng.choice(street)
+                    add(u, v, mode, minutes + rng.randint(0, 2), cost, 300)
+
+    return G
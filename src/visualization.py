@@ -1,20 +1,131 @@
-from typing import List, Optional
+import weakref
+from typing import Dict, List, Optional
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+from matplotlib.collections import LineCollection
 
 from utils import load_default_graph, path_stats
 
 
-def draw_graph(G: nx.DiGraph, ax=None, show_labels: bool = True):
-    """Grafı (soyut koordinatlara göre) çizer."""
+# Mod -> çizim rengi (LineCollection renk tablosu bu sırayla kurulur)
+MODE_COLORS = {
+    "metro": "tab:red",
+    "bus": "tab:blue",
+    "train": "tab:purple",
+    "walk": "tab:gray",
+    "bike": "tab:green",
+    "car": "tab:orange",
+}
+_OTHER_COLOR = "black"
+
+# G -> render_arrays sonucu. Graf dışında tutulur: G pickle'lanınca (ör.
+# işçi süreçlere gönderilince) önbellek taşınmaz; graf silinince kendiliğinden düşer.
+_RENDER_CACHE: "weakref.WeakKeyDictionary[nx.DiGraph, Dict]" = weakref.WeakKeyDictionary()
+
+
+# -----------------------------
+#  Koordinat önbelleği
+# -----------------------------
+def render_arrays(G: nx.DiGraph, refresh: bool = False) -> Dict:
+    """
+    Çizim için koordinat dizilerini bir kez hesaplayıp modül önbelleğinde saklar.
+    Düğüm/kenar sayısı değişirse önbellek kendiliğinden yeniden kurulur; sayıyı
+    değiştirmeyen düzenlemelerden (x/y, mode, kenar değiştirme) sonra
+    `invalidate_render_cache(G)` çağrılmalı ya da `refresh=True` verilmelidir.
+
+      - nodes, index: düğüm listesi ve id -> indeks
+      - xy:           (N, 2) düğüm koordinatları
+      - segments:     (E, 2, 2) kenar uç noktaları
+      - mode_code:    (E,) MODE_COLORS sırasına göre mod kodu (bilinmeyen = len)
+      - lod_rank:     (E,) sabit rastgele sıra; ayrıntı seviyesi seçimi için
+      - pos:          NetworkX fonksiyonları için {düğüm: (x, y)}
+    """
+    key = (G.number_of_nodes(), G.number_of_edges())
+    cache = _RENDER_CACHE.get(G)
+    if cache is not None and cache["key"] == key and not refresh:
+        return cache
+
+    nodes = list(G.nodes())
+    index = {n: i for i, n in enumerate(nodes)}
+    xy = np.asarray([(G.nodes[n]["x"], G.nodes[n]["y"]) for n in nodes], dtype=float)
+    xy = xy.reshape(-1, 2)
+
+    mode_ids = {m: i for i, m in enumerate(MODE_COLORS)}
+    n_edges = G.number_of_edges()
+    src = np.empty(n_edges, dtype=np.int64)
+    dst = np.empty(n_edges, dtype=np.int64)
+    mode_code = np.empty(n_edges, dtype=np.uint8)
+    for e, (u, v, mode) in enumerate(G.edges(data="mode")):
+        src[e] = index[u]
+        dst[e] = index[v]
+        mode_code[e] = mode_ids.get(mode, len(mode_ids))
+
+    cache = {
+        "key": key,
+        "nodes": nodes,
+        "index": index,
+        "xy": xy,
+        "segments": np.stack([xy[src], xy[dst]], axis=1),
+        "mode_code": mode_code,
+        "lod_rank": np.random.default_rng(0).permutation(n_edges),
+        "pos": {n: (float(x), float(y)) for n, (x, y) in zip(nodes, xy)},
+    }
+    _RENDER_CACHE[G] = cache
+    return cache
+
+
+def invalidate_render_cache(G: nx.DiGraph) -> None:
+    """G'nin render_arrays önbelleğini düşürür (öznitelik düzenlemelerinden sonra)."""
+    _RENDER_CACHE.pop(G, None)
+
+
+def _positions(G: nx.DiGraph) -> Dict[str, tuple]:
+    """draw_graph / draw_path için önbellekten pos sözlüğü."""
+    return render_arrays(G)["pos"]
+
+
+def draw_graph(
+    G: nx.DiGraph,
+    ax=None,
+    show_labels: bool = True,
+    node_values: Optional[Dict[str, float]] = None,
+    cmap: str = "viridis",
+):
+    """
+    Grafı (soyut koordinatlara göre) çizer.
+
+    node_values verilirse düğümler bu değerlere göre renklendirilir
+    (ör. varış süresi); değeri olmayan / sonsuz olan düğümler gri kalır.
+    """
     if ax is None:
         fig, ax = plt.subplots()
 
-    pos = {n: (G.nodes[n]["x"], G.nodes[n]["y"]) for n in G.nodes()}
+    pos = _positions(G)
 
     nx.draw_networkx_edges(G, pos, ax=ax, alpha=0.4)
-    nx.draw_networkx_nodes(G, pos, ax=ax, node_size=300)
+
+    if node_values is None:
+        nx.draw_networkx_nodes(G, pos, ax=ax, node_size=300)
+    else:
+        colored = [n for n in G.nodes() if np.isfinite(node_values.get(n, np.inf))]
+        colored_set = set(colored)
+        others = [n for n in G.nodes() if n not in colored_set]
+        nx.draw_networkx_nodes(
+            G, pos, nodelist=others, node_size=300, node_color="lightgray", ax=ax
+        )
+        if colored:
+            nodes = nx.draw_networkx_nodes(
+                G,
+                pos,
+                nodelist=colored,
+                node_size=300,
+                node_color=[node_values[n] for n in colored],
+                cmap=cmap,
+                ax=ax,
+            )
+            ax.figure.colorbar(nodes, ax=ax)
 
     if show_labels:
         labels = {n: G.nodes[n]["name"] for n in G.nodes()}
@@ -33,7 +144,7 @@ def draw_path(G: nx.DiGraph, path: List[str], ax=None):
 
     ax = draw_graph(G, ax=ax, show_labels=True)
 
-    pos = {n: (G.nodes[n]["x"], G.nodes[n]["y"]) for n in G.nodes()}
+    pos = _positions(G)
 
     # rota kenarlarını çiz
     path_edges = list(zip(path[:-1], path[1:]))
@@ -66,6 +177,203 @@ def draw_path(G: nx.DiGraph, path: List[str], ax=None):
     return ax
 
 
+# -----------------------------
+#  Büyük graflar için hızlı çizim
+# -----------------------------
+def _mode_color_table() -> np.ndarray:
+    """Mod kodu -> RGBA tablosu (son satır bilinmeyen modlar için)."""
+    from matplotlib.colors import to_rgba
+
+    colors = list(MODE_COLORS.values()) + [_OTHER_COLOR]
+    return np.asarray([to_rgba(c) for c in colors], dtype=float)
+
+
+def select_edges(
+    segments: np.ndarray,
+    lod_rank: np.ndarray,
+    viewport=None,
+    max_edges: Optional[int] = 200_000,
+) -> np.ndarray:
+    """
+    Çizilecek kenar indekslerini seçer.
+
+    viewport = (xmin, xmax, ymin, ymax) verilirse sınırlayıcı kutusu görünür
+    alanla kesişmeyen kenarlar atılır. Kalan kenar sayısı max_edges'i
+    aşarsa lod_rank'e göre ilk max_edges kenar tutulur; sıra sabit
+    olduğundan yakınlaştırdıkça aynı kenarlara yenileri eklenir.
+    """
+    idx = np.arange(segments.shape[0])
+
+    if viewport is not None:
+        xmin, xmax, ymin, ymax = viewport
+        sx, sy = segments[:, :, 0], segments[:, :, 1]
+        visible = (
+            (sx.max(axis=1) >= xmin)
+            & (sx.min(axis=1) <= xmax)
+            & (sy.max(axis=1) >= ymin)
+            & (sy.min(axis=1) <= ymax)
+        )
+        idx = idx[visible]
+
+    if max_edges is not None and idx.size > max_edges:
+        keep = np.argpartition(lod_rank[idx], max_edges - 1)[:max_edges]
+        idx = np.sort(idx[keep])
+
+    return idx
+
+
+def draw_edges_fast(
+    ax,
+    segments: np.ndarray,
+    mode_code: np.ndarray,
+    lod_rank: Optional[np.ndarray] = None,
+    viewport=None,
+    max_edges: Optional[int] = 200_000,
+    linewidth: float = 0.5,
+    alpha: float = 0.6,
+):
+    """
+    Kenarları tek bir LineCollection ile çizer (kenar başına artist yok).
+    Dizi tabanlı olduğu için NetworkX grafı olmadan da kullanılabilir.
+    """
+    if lod_rank is None:
+        lod_rank = np.arange(segments.shape[0])
+    idx = select_edges(segments, lod_rank, viewport, max_edges)
+
+    lc = LineCollection(
+        segments[idx],
+        colors=_mode_color_table()[mode_code[idx]],
+        linewidths=linewidth,
+        alpha=alpha,
+    )
+    ax.add_collection(lc)
+
+    if viewport is not None:
+        ax.set_xlim(viewport[0], viewport[1])
+        ax.set_ylim(viewport[2], viewport[3])
+    else:
+        ax.autoscale_view()
+
+    return lc
+
+
+def draw_graph_fast(
+    G: nx.DiGraph,
+    ax=None,
+    viewport=None,
+    max_edges: Optional[int] = 200_000,
+    show_nodes: bool = True,
+    linewidth: float = 0.5,
+) -> Dict:
+    """
+    Büyük graflar için temel katmanı çizer: kenarlar moda göre renkli tek
+    LineCollection, düğümler tek scatter. Dönen "layer" sözlüğü
+    overlay_route ile yalnızca rotanın yeniden çizilmesi için kullanılır.
+    """
+    if ax is None:
+        fig, ax = plt.subplots()
+
+    arrays = render_arrays(G)
+    edges = draw_edges_fast(
+        ax,
+        arrays["segments"],
+        arrays["mode_code"],
+        arrays["lod_rank"],
+        viewport=viewport,
+        max_edges=max_edges,
+        linewidth=linewidth,
+    )
+
+    artists = [edges]
+    if show_nodes:
+        xy = arrays["xy"]
+        if viewport is not None:
+            xmin, xmax, ymin, ymax = viewport
+            inside = (
+                (xy[:, 0] >= xmin) & (xy[:, 0] <= xmax) & (xy[:, 1] >= ymin) & (xy[:, 1] <= ymax)
+            )
+            xy = xy[inside]
+        artists.append(ax.scatter(xy[:, 0], xy[:, 1], s=2, color="black", zorder=2))
+
+    ax.set_axis_off()
+    # Görünür alan verildiyse sınırlar ayıklamayla aynı kalmalı: eşit oran
+    # eksen kutusu küçültülerek sağlanır ("datalim" sınırları genişletir ve
+    # kenarları atılmış boş bölgeler görünür).
+    ax.set_aspect("equal", adjustable="box" if viewport is not None else "datalim")
+
+    return {
+        "ax": ax,
+        "G": G,
+        "arrays": arrays,
+        "base": artists,
+        "route": [],
+        "background": None,
+    }
+
+
+def overlay_route(layer: Dict, path: List[str], blit: bool = True, color: str = "red"):
+    """
+    draw_graph_fast ile çizilmiş temel katmanın üstüne rotayı çizer.
+
+    blit=True ise temel katmanın piksel görüntüsü ilk çağrıda saklanır ve
+    sonraki rotalarda yalnızca bu görüntü geri yüklenip rota çizilir
+    (temel katman yeniden render edilmez). Bu modda rota artist'leri
+    "animated" olduğundan savefig çıktısına girmez; dosyaya kaydetmek
+    için blit=False kullanın.
+    """
+    ax = layer["ax"]
+    canvas = ax.figure.canvas
+    # katmanın çizildiği diziler; render_arrays'in anahtar kontrolü
+    # (number_of_edges, büyük graflarda O(N)) her rotada tekrarlanmaz
+    arrays = layer["arrays"]
+
+    for artist in layer["route"]:
+        artist.remove()
+
+    idx = np.asarray([arrays["index"][n] for n in path], dtype=np.int64)
+    xy = arrays["xy"][idx]
+    segs = np.stack([xy[:-1], xy[1:]], axis=1)
+
+    route_lines = LineCollection(segs, colors=color, linewidths=3.0, zorder=3, animated=blit)
+    ax.add_collection(route_lines)
+    route_nodes = ax.scatter(
+        xy[:, 0], xy[:, 1], s=30, color="orange", zorder=4, animated=blit
+    )
+    layer["route"] = [route_lines, route_nodes]
+
+    if not blit:
+        return layer
+
+    if layer["background"] is None:
+        canvas.draw()
+        layer["background"] = canvas.copy_from_bbox(ax.bbox)
+
+    canvas.restore_region(layer["background"])
+    ax.draw_artist(route_lines)
+    ax.draw_artist(route_nodes)
+    canvas.blit(ax.bbox)
+    return layer
+
+
+def draw_isochrone(G: nx.DiGraph, result: Dict, ax=None, show_labels: bool = True):
+    """
+    `isochrone.reachable_within` sonucunu çizer: düğümler varış süresine göre
+    renklenir, varsa erişim poligonu kesikli çizgiyle gösterilir.
+    """
+    node_values = dict(zip(result["nodes"], result["arrival"]))
+    ax = draw_graph(G, ax=ax, show_labels=show_labels, node_values=node_values)
+
+    polygon = result.get("polygon")
+    if polygon is not None and len(polygon) > 2:
+        ax.plot(polygon[:, 0], polygon[:, 1], linestyle="--", color="tab:blue")
+
+    ax.set_title(
+        f"{result['start']} çıkışlı {result['max_time']:g} dk erişim alanı "
+        f"({len(result['reachable'])} düğüm)"
+    )
+    return ax
+
+
 if __name__ == "__main__":
     # Küçük test: A* ile rota bul ve görselleştir
     from astar_solver import solve_astar_simple
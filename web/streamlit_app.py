@@ -1,8 +1,6 @@
 import os
 import sys
 import streamlit as st
-import pandas as pd
-import altair as alt
 
 # src klasörünü Python path'ine ekle
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -10,12 +8,54 @@ SRC_DIR = os.path.join(BASE_DIR, "src")
 if SRC_DIR not in sys.path:
     sys.path.append(SRC_DIR)
 
-from graph_builder import build_graph
-from astar_solver import solve_astar_constrained
-from nsga_solver import run_nsga2
+# Algoritmalar registry üzerinden ilk kullanımda import edilir (DEAP vb. açılışta yüklenmez)
+# Graf (ve pandas/numpy) ancak ilk "Rota Bul" tıklamasında yüklenir; seçim
+# kutuları düğüm isimlerini nodes.csv'den doğrudan okur.
+from registry import SOLVERS, get_graph, get_node_names, get_solver
+
+
+@st.cache_resource
+def load_graph():
+    """Grafı tüm oturumlar için ilk kullanımda bir kez yükler."""
+    return get_graph()
+
+
+def pareto_dataframe(sols):
+    """NSGA-II çözümlerini tablo/grafik için DataFrame'e döker."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "Rota": " → ".join(s["full_path"]),
+                "Süre (dk)": s["total_time"],
+                "Maliyet (TL)": s["total_cost"],
+                "Aktarma": int(s["transfers"]),
+            }
+            for s in sols
+        ]
+    )
+
+
+def pareto_chart(df):
+    """Süre vs maliyet Pareto scatter grafiği (renk: aktarma sayısı)."""
+    import altair as alt
+
+    return (
+        alt.Chart(df)
+        .mark_circle(size=80)
+        .encode(
+            x=alt.X("Süre (dk):Q", title="Toplam Süre (dk)"),
+            y=alt.Y("Maliyet (TL):Q", title="Toplam Maliyet (TL)"),
+            color=alt.Color("Aktarma:Q", title="Aktarma Sayısı"),
+            tooltip=["Rota", "Süre (dk)", "Maliyet (TL)", "Aktarma"],
+        )
+        .interactive()
+    )
+
 
-# --- GRAFİ YÜKLE ---
-G = build_graph("data/nodes.csv", "data/edges.csv")
+# --- DÜĞÜM LİSTESİ (graf yüklenmeden) ---
+node_ids = list(get_node_names())
 
 st.title("🚇 Multimodal Rota Belirleme ve Optimizasyon")
 
@@ -26,15 +66,15 @@ st.write(
 )
 
 # --- ALGORİTMA SEÇİMİ ---
-algo = st.radio("Algoritma", ["A* (kısıtlı)", "NSGA-II (çok amaçlı)"])
+algo = st.radio("Algoritma", [SOLVERS["astar"]["label"], SOLVERS["nsga2"]["label"]])
 
 # --- KULLANICI GİRDİLERİ ---
 col1, col2 = st.columns(2)
 
 with col1:
-    start = st.selectbox("Başlangıç noktası", list(G.nodes()), index=5)  # varsayılan N6
+    start = st.selectbox("Başlangıç noktası", node_ids, index=5)  # varsayılan N6
 with col2:
-    goal = st.selectbox("Hedef noktası", list(G.nodes()), index=7)       # varsayılan N8
+    goal = st.selectbox("Hedef noktası", node_ids, index=7)       # varsayılan N8
 
 st.subheader("🔧 Mod Seçimi (A* için geçerli)")
 available_modes = ["metro", "bus", "train", "walk", "bike", "car"]
@@ -50,9 +90,12 @@ max_time = st.slider("Maksimum süre (dakika)", 1, 120, 120)
 max_cost = st.slider("Maksimum maliyet (TL)", 0, 100, 100)
 
 if st.button("Rota Bul"):
+    G = load_graph()
+
     if algo.startswith("A*"):
         st.info(f"A* ile **{start} → {goal}** rotası hesaplanıyor...")
 
+        solve_astar_constrained = get_solver("astar")
         path, t, c = solve_astar_constrained(
             G,
             start,
@@ -78,31 +121,45 @@ if st.button("Rota Bul"):
         st.info(f"NSGA-II ile **{start} → {goal}** için Pareto-optimal rotalar aranıyor...")
 
         # NSGA-II şu anda sadece çok amaçlı çalışıyor; A* kısıtlarını kullanmıyor.
-        sols = run_nsga2(
+        # Sonuçlar her nesilde güncellenir: ilk cephe birinci nesilden sonra görünür.
+        progress = st.progress(0.0)
+        status = st.empty()
+        live_table = st.empty()
+        live_chart = st.empty()
+
+        iter_nsga2 = get_solver("nsga2_stream")
+        sols = []
+        for state in iter_nsga2(
             G,
             start,
             goal,
             n_generations=40,
             pop_size=40,
             max_intermediate_len=4,
-        )
+        ):
+            sols = state["front"]
+            gen, n_gen = state["generation"], state["n_generations"]
+            progress.progress(gen / n_gen)
+            status.caption(
+                f"Nesil {gen}/{n_gen} — {len(sols)} geçerli çözüm, "
+                f"{state['elapsed']:.2f} sn"
+            )
+            if sols:
+                live_df = pareto_dataframe(sols)
+                live_table.dataframe(live_df, use_container_width=True)
+                live_chart.altair_chart(pareto_chart(live_df), use_container_width=True)
+
+        # Canlı görünümü temizle; nihai sonuçlar aşağıda gösterilir
+        progress.empty()
+        status.empty()
+        live_table.empty()
+        live_chart.empty()
 
         if not sols:
             st.error("❌ Geçerli (ceza almamış) çözüm üretilmedi. "
                      "Bu başlangıç–hedef çifti için graf üzerinde yol olmayabilir.")
         else:
-            # DataFrame'e dök
-            df = pd.DataFrame(
-                [
-                    {
-                        "Rota": " → ".join(s["full_path"]),
-                        "Süre (dk)": s["total_time"],
-                        "Maliyet (TL)": s["total_cost"],
-                        "Aktarma": int(s["transfers"]),
-                    }
-                    for s in sols
-                ]
-            )
+            df = pareto_dataframe(sols)
 
             st.success(f"✔ {len(sols)} adet Pareto-optimal çözüm bulundu.")
             st.subheader("📊 Pareto Çözümler (NSGA-II)")
@@ -111,17 +168,7 @@ if st.button("Rota Bul"):
             # --- Pareto scatter grafiği (Süre vs Maliyet) ---
             st.subheader("⚖️ Pareto Grafiği: Süre vs Maliyet")
 
-            chart = (
-                alt.Chart(df)
-                .mark_circle(size=80)
-                .encode(
-                    x=alt.X("Süre (dk):Q", title="Toplam Süre (dk)"),
-                    y=alt.Y("Maliyet (TL):Q", title="Toplam Maliyet (TL)"),
-                    color=alt.Color("Aktarma:Q", title="Aktarma Sayısı"),
-                    tooltip=["Rota", "Süre (dk)", "Maliyet (TL)", "Aktarma"],
-                )
-                .interactive()
-            )
+            chart = pareto_chart(df)
 
             st.altair_chart(chart, use_container_width=True)
 